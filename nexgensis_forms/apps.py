@@ -15,6 +15,5 @@ class NexgensisFormsConfig(AppConfig):
         Import signals and perform app initialization.
         Called when Django starts.
         """
-        # Import signals if needed
-        # from . import signals
-        pass
+        # Import signals so their receivers are connected
+        from . import signals  # noqa: F401
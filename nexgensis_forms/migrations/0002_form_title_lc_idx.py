@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-16 03:48
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('nexgensis_forms', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='form',
+            index=models.Index(django.db.models.functions.text.Lower('title'), name='form_title_lc_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.db.models.functions import Lower
 from django.conf import settings
 from uuid_utils import uuid7
 from django.utils import timezone
@@ -199,6 +200,10 @@ class Form(TimestampedModel2):
                 name='unique_active_form_code'
             )
         ]
+        indexes = [
+            # Backs case-insensitive title lookups (e.g. bulk upload duplicate check)
+            models.Index(Lower('title'), name='form_title_lc_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,57 @@
+"""
+Renderers for Nexgensis Forms.
+
+Provides an orjson-backed JSON renderer for large API payloads such as
+bulk upload results and form listings.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+# Optional fast JSON encoder (installed with the "fast" extra)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes responses with orjson.
+
+    Types orjson does not handle natively (Decimal, lazy translation
+    strings, querysets, ...) fall back to DRF's JSONEncoder. Indented
+    output (e.g. requested through the Accept header) and environments
+    without orjson use the standard JSONRenderer.
+
+    Usage:
+        REST_FRAMEWORK = {
+            'DEFAULT_RENDERER_CLASSES': [
+                'nexgensis_forms.renderers.ORJSONRenderer',
+                'rest_framework.renderers.BrowsableAPIRenderer',
+            ],
+        }
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes.
+
+        Args:
+            data: Data to render
+            accepted_media_type: Accepted media type from content negotiation
+            renderer_context: Renderer context from the view
+
+        Returns:
+            bytes: JSON encoded data
+        """
+        if data is None:
+            return b''
+
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
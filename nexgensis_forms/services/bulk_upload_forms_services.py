@@ -24,10 +24,18 @@ Usage:
     result = bulk_upload_forms_service(excel_file=file, user=request.user)
 """
 
+import functools
+import itertools
 import json
 import logging
+import re
+import secrets
+import time
 from openpyxl import load_workbook
+
+from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
+from django.db.models.functions import Lower
 
 from ..models import (
     FormType, Form, FormSections, FormFields,
@@ -36,6 +44,15 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# JSON parser used for spreadsheet cells: orjson when the optional "fast"
+# extra is installed, otherwise the standard library. orjson's decode error
+# subclasses json.JSONDecodeError, so callers can catch either the same way.
+try:
+    import orjson
+    load_json = orjson.loads
+except ImportError:
+    load_json = json.loads
+
 
 # ===============================
 # Column Mapping Configuration
@@ -74,6 +91,12 @@ COLUMN_MAPPING = {
     "Additional Info": "additional_info",
 }
 
+# Normalized field name -> original column name
+REVERSE_COLUMN_MAPPING = {normalized: original for original, normalized in COLUMN_MAPPING.items()}
+
+if len(REVERSE_COLUMN_MAPPING) != len(COLUMN_MAPPING):
+    raise ImproperlyConfigured("COLUMN_MAPPING maps more than one column to the same field name.")
+
 
 # Required fields for each sheet
 REQUIRED_FIELDS = {
@@ -105,6 +128,138 @@ SHEET_NAMES = {
 }
 
 
+# Columns holding JSON, parsed once when the sheet is read
+JSON_COLUMNS = {
+    "sections": ("dependency",),
+    "fields": ("options", "validation", "field_dependency", "additional_info"),
+}
+
+
+# Lowercased lookup keys added to each parsed row: {row key: column}
+ROW_KEY_COLUMNS = {
+    "_form_key": "form_title",
+    "_section_key": "section_name",
+    "_label_key": "field_label",
+    "_parent_key": "parent_field",
+}
+
+
+# Draft validation keys per data type, with defaults used when the field's
+# additional_info does not set them
+VALIDATION_TEMPLATES = {
+    "select": {"isMultiple": False, "maxSelection": ""},
+    "text": {"pattern": "", "maxLength": "", "minLength": 0},
+    "number": {"min": "", "max": ""},
+    "file": {"fileType": "", "isMultiple": False, "maxFileSize": ""},
+}
+
+
+# Rows per INSERT/UPDATE statement for bulk_create and bulk_update, keeping
+# statements for very large uploads within database parameter limits
+BULK_BATCH_SIZE = 500
+
+
+# Accepted boolean spellings (compared upper-cased)
+BOOLEAN_VALUES = frozenset({"TRUE", "FALSE", "YES", "NO", "1", "0"})
+
+# Longest accepted boolean spelling; longer cells are rejected without upper-casing
+BOOLEAN_MAX_LENGTH = max(len(value) for value in BOOLEAN_VALUES)
+
+# Boolean spellings that parse to True
+TRUTHY_VALUES = frozenset({"TRUE", "YES", "1"})
+
+
+# Keywords in a field type name or label that make a field dynamic, mapped to
+# the API endpoint that supplies its options. Earlier keywords take priority.
+DYNAMIC_FIELD_ENDPOINTS = {
+    "location": "/api/config/locations/",
+    "department": "/api/config/departments/",
+    "designation": "/api/config/designations/",
+    "role": "/api/config/roles/",
+    "employee": "/api/config/employees/list/",
+    "user": "/api/config/employees/list/",
+}
+
+# Matches any dynamic keyword; used to skip the keyword scan for ordinary fields
+DYNAMIC_FIELD_PATTERN = re.compile("|".join(map(re.escape, DYNAMIC_FIELD_ENDPOINTS)))
+
+# Suffix counter for generate_unique_field_name: names never repeat within a
+# process, and the random start keeps separate worker processes apart
+FIELD_NAME_COUNTER = itertools.count(secrets.randbelow(0x1000000))
+
+# Error message templates shared by the sheet validators, formatted only
+# when an error is recorded
+ERROR_MESSAGES = {
+    "missing_data": "Missing required data in column(s): {columns}",
+    "form_not_found": "Form '{form_title}' not found in Forms sheet.",
+    "invalid_dropdown": "'{value}' is not a valid {column}. Must be selected from dropdown.",
+    "invalid_dependency_json": "Invalid JSON format for Dependency field.",
+    "invalid_integer": "{column} must be a valid integer.",
+    "non_positive_integer": "{column} must be a positive integer.",
+    "invalid_boolean": "'{value}' is not a valid boolean. Use TRUE or FALSE.",
+}
+
+
+# ===============================
+# Validation Error Log
+# ===============================
+
+class ValidationErrorLog:
+    """
+    Validation errors found in the uploaded workbook.
+
+    Errors are stored column-wise in parallel lists rather than as one
+    dictionary per error, and are only converted to the response format
+    once validation has finished.
+    """
+    __slots__ = ("rows", "sheets", "types", "columns", "invalid_values", "messages")
+
+    def __init__(self):
+        self.rows = []
+        self.sheets = []
+        self.types = []
+        self.columns = []
+        self.invalid_values = []
+        self.messages = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def add(self, row, sheet, type, message, column=None, invalid_value=None):
+        """Record a single validation error."""
+        self.rows.append(row)
+        self.sheets.append(sheet)
+        self.types.append(type)
+        self.columns.append(column)
+        self.invalid_values.append(invalid_value)
+        self.messages.append(message)
+
+    def extend(self, other):
+        """Append all errors recorded in another log."""
+        for name in self.__slots__:
+            getattr(self, name).extend(getattr(other, name))
+
+    def as_dicts(self):
+        """
+        Return the errors in the API response format.
+
+        Returns:
+            list: List of validation error dictionaries
+        """
+        errors = []
+        for row, sheet, type, column, invalid_value, message in zip(
+            self.rows, self.sheets, self.types, self.columns, self.invalid_values, self.messages
+        ):
+            error = {"row": row, "sheet": sheet, "type": type}
+            if column is not None:
+                error["column"] = column
+            if invalid_value is not None:
+                error["invalid_value"] = invalid_value
+            error["message"] = message
+            errors.append(error)
+        return errors
+
+
 # ===============================
 # Main Bulk Upload Function
 # ===============================
@@ -185,13 +340,10 @@ def bulk_upload_forms_service(file, user):
             return {"status": "failed", "message": "No forms found in the Forms sheet."}
 
         # VALIDATION PHASE - Check all sheets before processing
-        print("\n=== Starting Validation ===")
-        validation_errors = validate_all_sheets(parsed_data, user)
+        validation_errors = validate_all_sheets(parsed_data)
 
         if validation_errors:
-            print(f"Validation FAILED with {len(validation_errors)} errors")
-            for error in validation_errors[:5]:  # Show first 5 errors
-                print(f"  - Row {error.get('row')}, Sheet {error.get('sheet')}: {error.get('message')}")
+            logger.debug("Bulk upload validation failed with %d errors", len(validation_errors))
             return {
                 "status": "failed",
                 "message": "Validation failed. Please fix the errors below and re-upload the file.",
@@ -199,33 +351,42 @@ def bulk_upload_forms_service(file, user):
                 "total_errors": len(validation_errors)
             }
 
-        print("Validation PASSED! Starting form creation...")
 
         # PROCESSING PHASE - Only if validation passes
         success_messages = []
         error_messages = []
         created_forms = []
+        form_type_cache = {}
+        form_drafts = []
+
+        # Group section and field rows by form once for all forms
+        parsed_data["sections_by_form"] = group_rows_by_form(parsed_data.get("sections", []))
+        parsed_data["fields_by_form"] = group_rows_by_form(parsed_data.get("fields", []))
+
+        # Only the writes run inside a transaction; parsing and validation
+        # above hold no transaction open. Each form is created in its own
+        # savepoint so one failing form does not undo the others.
+        with transaction.atomic():
+            for idx, form_data in enumerate(parsed_data["forms"], start=1):
+                logger.debug("Processing form %d/%d: %s", idx, len(parsed_data["forms"]), form_data.get("form_title"))
+                try:
+                    result = create_single_form(form_data, parsed_data, user, form_type_cache)
 
-        print(f"\n=== Processing {len(parsed_data['forms'])} forms ===")
-        for idx, form_data in enumerate(parsed_data["forms"], start=1):
-            print(f"\nProcessing form {idx}/{len(parsed_data['forms'])}")
-            print(f"Form data: {form_data}")
-            print(f"Calling create_single_form...")
-            try:
-                result = create_single_form(form_data, parsed_data, user)
-                print(f"create_single_form returned: {result.get('status')}")
-
-                if result.get("status") == "success":
-                    success_messages.append(result["message"])
-                    created_forms.append(result["form_info"])
-                else:
-                    error_messages.append(result["message"])
+                    if result.get("status") == "success":
+                        success_messages.append(result["message"])
+                        created_forms.append(result["form_info"])
+                        form_drafts.append(result["form_draft"])
+                    else:
+                        error_messages.append(result["message"])
 
-            except Exception as e:
-                logger.exception(f"Error creating form '{form_data.get('form_title')}': {e}")
-                error_messages.append(
-                    f"Form '{form_data.get('form_title')}': Unexpected error - {str(e)}"
-                )
+                except Exception as e:
+                    logger.exception(f"Error creating form '{form_data.get('form_title')}': {e}")
+                    error_messages.append(
+                        f"Form '{form_data.get('form_title')}': Unexpected error - {str(e)}"
+                    )
+
+            # Save the drafts of all created forms in batches
+            FormDraft.objects.bulk_create(form_drafts, batch_size=BULK_BATCH_SIZE)
 
         return {
             "status": "success" if not error_messages else "partial_success",
@@ -274,7 +435,9 @@ def parse_excel_file_multisheet(file):
         Exception: If file cannot be read or required sheets are missing
     """
     try:
-        wb = load_workbook(file, data_only=True)
+        # Read-only mode streams rows from the file instead of building the
+        # full cell graph (with styles) in memory
+        wb = load_workbook(file, read_only=True, data_only=True)
     except Exception as e:
         logger.error("Error reading Excel file: %s", e)
         raise Exception("Unable to read Excel file. Please ensure it's a valid Excel file.")
@@ -285,28 +448,23 @@ def parse_excel_file_multisheet(file):
         "fields": []
     }
 
-    # Parse Forms sheet
-    if SHEET_NAMES["forms"] in wb.sheetnames:
-        result["forms"] = parse_sheet(wb[SHEET_NAMES["forms"]], "forms")
-        print(f"\n=== Parsed {len(result['forms'])} forms from Excel ===")
-        for form in result["forms"]:
-            print(f"Form: {form.get('form_title')}")
-    else:
-        raise Exception(f"Required sheet '{SHEET_NAMES['forms']}' not found in Excel file.")
-
-    # Parse Sections sheet
-    if SHEET_NAMES["sections"] in wb.sheetnames:
-        result["sections"] = parse_sheet(wb[SHEET_NAMES["sections"]], "sections")
-        print(f"\n=== Parsed {len(result['sections'])} sections from Excel ===")
-        for section in result["sections"]:
-            print(f"Section: {section.get('section_name')} for form: {section.get('form_title')}")
-
-    # Parse Fields sheet
-    if SHEET_NAMES["fields"] in wb.sheetnames:
-        result["fields"] = parse_sheet(wb[SHEET_NAMES["fields"]], "fields")
-        print(f"\n=== Parsed {len(result['fields'])} fields from Excel ===")
-        for field in result["fields"]:
-            print(f"Field: {field.get('field_label')} in section: {field.get('section_name')} for form: {field.get('form_title')}")
+    try:
+        # Parse Forms sheet
+        if SHEET_NAMES["forms"] in wb.sheetnames:
+            result["forms"] = parse_sheet(wb[SHEET_NAMES["forms"]], "forms")
+        else:
+            raise Exception(f"Required sheet '{SHEET_NAMES['forms']}' not found in Excel file.")
+
+        # Parse Sections sheet
+        if SHEET_NAMES["sections"] in wb.sheetnames:
+            result["sections"] = parse_sheet(wb[SHEET_NAMES["sections"]], "sections")
+
+        # Parse Fields sheet
+        if SHEET_NAMES["fields"] in wb.sheetnames:
+            result["fields"] = parse_sheet(wb[SHEET_NAMES["fields"]], "fields")
+    finally:
+        # Read-only workbooks keep the file open until closed
+        wb.close()
 
     return result
 
@@ -335,18 +493,34 @@ def parse_sheet(worksheet, sheet_type):
     for col in header:
         normalized_header.append(COLUMN_MAPPING.get(col, col.lower().replace(" ", "_")))
 
-    # Read data starting from row 4, skip empty rows
+    json_columns = JSON_COLUMNS.get(sheet_type, ())
+
+    # Read data starting from row 4, skip empty rows. max_col pads short rows,
+    # as read-only sheets omit trailing empty cells.
     rows = []
-    for row in worksheet.iter_rows(min_row=4, values_only=True):
+    for row in worksheet.iter_rows(min_row=4, max_col=len(header), values_only=True):
         # Skip completely empty rows
         if all(cell is None or str(cell).strip() == "" for cell in row):
             continue
 
-        row_dict = dict(zip(normalized_header, row))
+        # Strip text cells once here; blank text becomes None like an empty cell
+        row_dict = {
+            key: (value.strip() or None) if isinstance(value, str) else value
+            for key, value in zip(normalized_header, row)
+        }
 
         # Add sheet_type for tracking
         row_dict["_sheet_type"] = sheet_type
 
+        # Lowercase the lookup columns once for case-insensitive matching;
+        # a column missing from the sheet gives an empty key, like an empty cell
+        for row_key, column in ROW_KEY_COLUMNS.items():
+            row_dict[row_key] = clean_str(row_dict.get(column)).lower()
+
+        # Parse JSON columns once; invalid JSON is reported by validation
+        if json_columns:
+            row_dict["_json"] = parse_json_columns(row_dict, json_columns)
+
         rows.append(row_dict)
 
     return rows
@@ -356,7 +530,7 @@ def parse_sheet(worksheet, sheet_type):
 # Validation Functions
 # ===============================
 
-def validate_all_sheets(parsed_data, user):
+def validate_all_sheets(parsed_data):
     """
     Validate all sheets for:
     1. Missing required data
@@ -368,241 +542,286 @@ def validate_all_sheets(parsed_data, user):
 
     Args:
         parsed_data (dict): Parsed data from all sheets
-        user: Current user
 
     Returns:
         list: List of validation error dictionaries
     """
-    validation_errors = []
+    context = build_validation_context(parsed_data)
+
+    validation_errors = ValidationErrorLog()
+    validation_errors.extend(validate_forms_sheet(parsed_data, context))
+    validation_errors.extend(validate_sections_sheet(parsed_data, context))
+    validation_errors.extend(validate_fields_sheet(parsed_data, context))
+
+    return validation_errors.as_dicts()
 
-    # Fetch valid dropdown values from database
-    # FormType uses effective_end_date for soft delete
-    valid_form_types = list(
-        FormType.objects.filter(effective_end_date__isnull=True)
-        .values_list("name", flat=True)
-    )
 
-    # FieldType uses is_deleted for soft delete
-    valid_field_types = list(
-        FieldType.objects.filter(is_deleted=False)
-        .values_list("name", flat=True)
+def build_validation_context(parsed_data):
+    """
+    Build the lookups shared by the sheet validators.
+
+    Fetches valid dropdown values from the database and indexes the form
+    titles, section names and field rows declared in the file, so that each
+    sheet can be validated independently of the others and every per-row
+    check is a set or dict lookup.
+
+    Args:
+        parsed_data (dict): Parsed data from all sheets
+
+    Returns:
+        dict: Shared validation context
+    """
+    # Fetch valid dropdown values from database, lowercased for O(1) lookups
+    # FormType uses effective_end_date for soft delete
+    form_types_lc = frozenset(
+        name.lower() for name in
+        FormType.objects.filter(effective_end_date__isnull=True).values_list("name", flat=True)
     )
 
     # DataType uses is_deleted for soft delete
-    valid_data_types = list(
-        DataType.objects.filter(is_deleted=False)
-        .values_list("name", flat=True)
+    data_types_lc = frozenset(
+        name.lower() for name in
+        DataType.objects.filter(is_deleted=False).values_list("name", flat=True)
     )
 
-    # Get field type to data type mapping
+    # FieldType uses is_deleted for soft delete; one query gives both the
+    # valid names and the field type to data type mapping
     field_type_data_type_map = {}
     for ft in FieldType.objects.filter(is_deleted=False).select_related('data_type'):
         field_type_data_type_map[ft.name] = ft.data_type.name
+    field_types_lc = frozenset(name.lower() for name in field_type_data_type_map)
+
+    # Build lowercased form titles from Forms sheet for cross-sheet validation
+    form_titles_lc = {row["_form_key"] for row in parsed_data.get("forms", []) if row.get("_form_key")}
+
+    # Titles from the file that already belong to active forms, fetched in one
+    # query against the form_title_lc_idx functional index
+    existing_titles_lc = set()
+    if form_titles_lc:
+        existing_titles_lc = set(
+            Form.objects.annotate(title_lc=Lower("title"))
+            .filter(title_lc__in=form_titles_lc, effective_end_date__isnull=True)
+            .values_list("title_lc", flat=True)
+        )
+
+    # Build lowercased sections map for cross-sheet validation: {form_title: frozenset(section_names)}
+    section_names_lc = {}
+    for row in parsed_data.get("sections", []):
+        form_title_lc = row.get("_form_key")
+        section_name_lc = row.get("_section_key")
+        if form_title_lc and section_name_lc:
+            section_names_lc.setdefault(form_title_lc, set()).add(section_name_lc)
+    sections_map_lc = {form_title_lc: frozenset(names) for form_title_lc, names in section_names_lc.items()}
+
+    # Index field rows for dependency checks, lowercased like the other maps:
+    # {(form_title, section_name, field_label): parsed options}
+    # The first row wins, as with the previous linear search
+    fields_index = {}
+    for row in parsed_data.get("fields", []):
+        field_key = (row.get("_form_key", ""), row.get("_section_key", ""), row.get("_label_key", ""))
+        fields_index.setdefault(field_key, row["_json"].get("options"))
+
+    return {
+        "form_types_lc": form_types_lc,
+        "field_types_lc": field_types_lc,
+        "data_types_lc": data_types_lc,
+        "field_type_data_type_map": field_type_data_type_map,
+        "form_titles_lc": form_titles_lc,
+        "existing_titles_lc": existing_titles_lc,
+        "sections_map_lc": sections_map_lc,
+        "fields_index": fields_index,
+    }
+
+
+def validate_forms_sheet(parsed_data, context):
+    """
+    Validate the Forms sheet: required data, form type dropdown,
+    duplicate titles (in file and database) and the Is Completed flag.
+
+    Args:
+        parsed_data (dict): Parsed data from all sheets
+        context (dict): Shared lookups from build_validation_context()
+
+    Returns:
+        ValidationErrorLog: Errors found in the sheet
+    """
+    validation_errors = ValidationErrorLog()
+    form_types_lc = context["form_types_lc"]
+    existing_titles_lc = context["existing_titles_lc"]
 
     # Track seen values for duplicate detection
     seen_form_titles = set()
-    seen_sections = set()  # (form_title, section_name)
-    seen_section_orders = set()  # (form_title, section_order)
-    seen_fields = set()  # (form_title, section_name, field_label)
-    seen_field_orders = set()  # (form_title, section_name, field_order)
 
-    # Build form titles from Forms sheet for cross-sheet validation
-    form_titles_in_file = {str(row.get("form_title")).strip() for row in parsed_data.get("forms", [])
-                           if row.get("form_title") and str(row.get("form_title")).strip()}
+    # Display names of the required columns, resolved once per sheet
+    required_columns = {field: get_original_column_name(field) for field in REQUIRED_FIELDS["forms"]}
 
-    # Build sections map for cross-sheet validation: {form_title: [section_names]}
-    sections_map = {}
-    for row in parsed_data.get("sections", []):
-        form_title = row.get("form_title")
-        section_name = row.get("section_name")
-        if form_title and section_name:
-            form_title_str = str(form_title).strip()
-            section_name_str = str(section_name).strip()
-            if form_title_str and section_name_str:
-                if form_title_str not in sections_map:
-                    sections_map[form_title_str] = set()
-                sections_map[form_title_str].add(section_name_str)
-
-    # =========================
-    # VALIDATE FORMS SHEET
-    # =========================
     for idx, row_data in enumerate(parsed_data.get("forms", []), start=1):
         actual_row = idx + 3  # Row 1=Title, Row 2=Note, Row 3=Header, Data starts at 4
 
         # 1. Check required fields
         missing_fields = []
-        for field in REQUIRED_FIELDS["forms"]:
+        for field, column_name in required_columns.items():
             value = row_data.get(field)
             if value is None or str(value).strip() == "":
-                original_col_name = get_original_column_name(field)
-                missing_fields.append(original_col_name)
+                missing_fields.append(column_name)
 
         if missing_fields:
-            validation_errors.append({
-                "row": actual_row,
-                "sheet": SHEET_NAMES["forms"],
-                "type": "Missing Data",
-                "message": f"Missing required data in column(s): {', '.join(missing_fields)}"
-            })
+            validation_errors.add(
+                row=actual_row,
+                sheet=SHEET_NAMES["forms"],
+                type="Missing Data",
+                message=ERROR_MESSAGES["missing_data"].format(columns=", ".join(missing_fields))
+            )
 
         # 2. Validate dropdown: form_type
         form_type = row_data.get("form_type")
         if form_type and str(form_type).strip():
             form_type_str = str(form_type).strip()
-            if not any(form_type_str.lower() == ft.lower() for ft in valid_form_types):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["forms"],
-                    "type": "Invalid Dropdown Value",
-                    "column": "Form Type",
-                    "invalid_value": form_type_str,
-                    "message": f"'{form_type_str}' is not a valid Form Type. Must be selected from dropdown."
-                })
+            if form_type_str.lower() not in form_types_lc:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["forms"],
+                    type="Invalid Dropdown Value",
+                    column="Form Type",
+                    invalid_value=form_type_str,
+                    message=ERROR_MESSAGES["invalid_dropdown"].format(value=form_type_str, column="Form Type")
+                )
 
         # 3. Check duplicate form_title in file
         form_title = row_data.get("form_title")
         if form_title and str(form_title).strip():
             form_title_str = str(form_title).strip()
 
-            if form_title_str.lower() in seen_form_titles:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["forms"],
-                    "type": "Duplicate in File",
-                    "column": "Form Title",
-                    "invalid_value": form_title_str,
-                    "message": f"Form title '{form_title_str}' appears multiple times in this file."
-                })
+            if row_data["_form_key"] in seen_form_titles:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["forms"],
+                    type="Duplicate in File",
+                    column="Form Title",
+                    invalid_value=form_title_str,
+                    message=f"Form title '{form_title_str}' appears multiple times in this file."
+                )
             else:
-                seen_form_titles.add(form_title_str.lower())
+                seen_form_titles.add(row_data["_form_key"])
 
             # 4. Check duplicate form_title in database
-            if Form.objects.filter(
-                title__iexact=form_title_str,
-                effective_end_date__isnull=True
-            ).exists():
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["forms"],
-                    "type": "Duplicate Entry",
-                    "column": "Form Title",
-                    "invalid_value": form_title_str,
-                    "message": f"Form with title '{form_title_str}' already exists in database."
-                })
+            if row_data["_form_key"] in existing_titles_lc:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["forms"],
+                    type="Duplicate Entry",
+                    column="Form Title",
+                    invalid_value=form_title_str,
+                    message=f"Form with title '{form_title_str}' already exists in database."
+                )
 
         # 5. Validate is_completed field (should be TRUE/FALSE or boolean)
-        is_completed = row_data.get("is_completed")
-        if is_completed is not None and str(is_completed).strip():
-            is_completed_str = str(is_completed).strip().upper()
-            if is_completed_str not in ["TRUE", "FALSE", "YES", "NO", "1", "0"]:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["forms"],
-                    "type": "Invalid Format",
-                    "column": "Is Completed",
-                    "invalid_value": str(is_completed),
-                    "message": f"'{is_completed}' is not a valid boolean. Use TRUE or FALSE."
-                })
-
-    # =========================
-    # VALIDATE SECTIONS SHEET
-    # =========================
+        validate_boolean(
+            row_data.get("is_completed"), validation_errors,
+            row=actual_row, sheet=SHEET_NAMES["forms"], column="Is Completed"
+        )
+
+    return validation_errors
+
+
+def validate_sections_sheet(parsed_data, context):
+    """
+    Validate the Sections sheet: required data, form references, section
+    order, duplicates and section dependencies.
+
+    Args:
+        parsed_data (dict): Parsed data from all sheets
+        context (dict): Shared lookups from build_validation_context()
+
+    Returns:
+        ValidationErrorLog: Errors found in the sheet
+    """
+    validation_errors = ValidationErrorLog()
+    form_titles_lc = context["form_titles_lc"]
+    sections_map_lc = context["sections_map_lc"]
+    fields_index = context["fields_index"]
+
+    # Track seen values for duplicate detection
+    seen_sections = set()  # (form_title, section_name)
+    seen_section_orders = set()  # (form_title, section_order)
+
+    # Display names of the required columns, resolved once per sheet
+    required_columns = {field: get_original_column_name(field) for field in REQUIRED_FIELDS["sections"]}
+
     for idx, row_data in enumerate(parsed_data.get("sections", []), start=1):
         actual_row = idx + 3
 
         # 1. Check required fields
         missing_fields = []
-        for field in REQUIRED_FIELDS["sections"]:
+        for field, column_name in required_columns.items():
             value = row_data.get(field)
             if value is None or str(value).strip() == "":
-                original_col_name = get_original_column_name(field)
-                missing_fields.append(original_col_name)
+                missing_fields.append(column_name)
 
         if missing_fields:
-            validation_errors.append({
-                "row": actual_row,
-                "sheet": SHEET_NAMES["sections"],
-                "type": "Missing Data",
-                "message": f"Missing required data in column(s): {', '.join(missing_fields)}"
-            })
+            validation_errors.add(
+                row=actual_row,
+                sheet=SHEET_NAMES["sections"],
+                type="Missing Data",
+                message=ERROR_MESSAGES["missing_data"].format(columns=", ".join(missing_fields))
+            )
 
         # 2. Validate form_title exists in Forms sheet
         form_title = row_data.get("form_title")
         if form_title and str(form_title).strip():
             form_title_str = str(form_title).strip()
-            if form_title_str not in form_titles_in_file:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["sections"],
-                    "type": "Invalid Reference",
-                    "column": "Form Title",
-                    "invalid_value": form_title_str,
-                    "message": f"Form '{form_title_str}' not found in Forms sheet."
-                })
+            if row_data["_form_key"] not in form_titles_lc:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["sections"],
+                    type="Invalid Reference",
+                    column="Form Title",
+                    invalid_value=form_title_str,
+                    message=ERROR_MESSAGES["form_not_found"].format(form_title=form_title_str)
+                )
 
         # 3. Validate section_order is a positive integer
         section_order = row_data.get("section_order")
-        if section_order is not None:
-            try:
-                order_int = int(section_order)
-                if order_int <= 0:
-                    validation_errors.append({
-                        "row": actual_row,
-                        "sheet": SHEET_NAMES["sections"],
-                        "type": "Invalid Format",
-                        "column": "Section Order",
-                        "invalid_value": str(section_order),
-                        "message": "Section Order must be a positive integer."
-                    })
-            except (ValueError, TypeError):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["sections"],
-                    "type": "Invalid Format",
-                    "column": "Section Order",
-                    "invalid_value": str(section_order),
-                    "message": "Section Order must be a valid integer."
-                })
+        order_int = validate_positive_int(
+            section_order, validation_errors,
+            row=actual_row, sheet=SHEET_NAMES["sections"], column="Section Order"
+        )
 
         # 4. Check duplicate (form_title, section_name)
         section_name = row_data.get("section_name")
         if form_title and section_name:
             form_title_str = str(form_title).strip()
             section_name_str = str(section_name).strip()
-            section_key = (form_title_str.lower(), section_name_str.lower())
+            section_key = (row_data["_form_key"], row_data["_section_key"])
 
             if section_key in seen_sections:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["sections"],
-                    "type": "Duplicate in File",
-                    "column": "Section Name",
-                    "invalid_value": section_name_str,
-                    "message": f"Section '{section_name_str}' appears multiple times for form '{form_title_str}'."
-                })
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["sections"],
+                    type="Duplicate in File",
+                    column="Section Name",
+                    invalid_value=section_name_str,
+                    message=f"Section '{section_name_str}' appears multiple times for form '{form_title_str}'."
+                )
             else:
                 seen_sections.add(section_key)
 
         # 5. Check duplicate (form_title, section_order)
-        if form_title and section_order is not None:
+        if form_title and order_int is not None:
             form_title_str = str(form_title).strip()
-            try:
-                order_int = int(section_order)
-                order_key = (form_title_str.lower(), order_int)
-
-                if order_key in seen_section_orders:
-                    validation_errors.append({
-                        "row": actual_row,
-                        "sheet": SHEET_NAMES["sections"],
-                        "type": "Duplicate in File",
-                        "column": "Section Order",
-                        "invalid_value": str(section_order),
-                        "message": f"Section Order {section_order} is used multiple times for form '{form_title_str}'."
-                    })
-                else:
-                    seen_section_orders.add(order_key)
-            except (ValueError, TypeError):
-                pass  # Already handled above
+            order_key = (row_data["_form_key"], order_int)
+
+            if order_key in seen_section_orders:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["sections"],
+                    type="Duplicate in File",
+                    column="Section Order",
+                    invalid_value=str(section_order),
+                    message=f"Section Order {section_order} is used multiple times for form '{form_title_str}'."
+                )
+            else:
+                seen_section_orders.add(order_key)
 
         # 6. Validate simple dependency columns
         dep_section = row_data.get("dependency_section")
@@ -625,12 +844,12 @@ def validate_all_sheets(parsed_data, user):
                 missing_dep_cols.append("Dependency Option")
 
             if missing_dep_cols:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["sections"],
-                    "type": "Missing Data",
-                    "message": f"When using simple dependency, all three columns must be filled: {', '.join(missing_dep_cols)}"
-                })
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["sections"],
+                    type="Missing Data",
+                    message=f"When using simple dependency, all three columns must be filled: {', '.join(missing_dep_cols)}"
+                )
             else:
                 # All three are provided - validate them
                 dep_section_str = str(dep_section).strip()
@@ -640,103 +859,119 @@ def validate_all_sheets(parsed_data, user):
                 # Validate dependency section exists in the same form
                 if form_title:
                     form_title_str = str(form_title).strip()
-                    if form_title_str in sections_map:
-                        if dep_section_str not in sections_map[form_title_str]:
-                            validation_errors.append({
-                                "row": actual_row,
-                                "sheet": SHEET_NAMES["sections"],
-                                "type": "Invalid Reference",
-                                "column": "Dependency Section",
-                                "invalid_value": dep_section_str,
-                                "message": f"Dependency section '{dep_section_str}' not found in Sections sheet for form '{form_title_str}'."
-                            })
+                    if row_data["_form_key"] in sections_map_lc:
+                        if dep_section_str.lower() not in sections_map_lc[row_data["_form_key"]]:
+                            validation_errors.add(
+                                row=actual_row,
+                                sheet=SHEET_NAMES["sections"],
+                                type="Invalid Reference",
+                                column="Dependency Section",
+                                invalid_value=dep_section_str,
+                                message=f"Dependency section '{dep_section_str}' not found in Sections sheet for form '{form_title_str}'."
+                            )
 
                 # Validate dependency field exists in the dependency section
-                field_found = False
-                field_options = []
-                for field_row in parsed_data.get("fields", []):
-                    if (str(field_row.get("form_title", "")).strip() == form_title_str and
-                        str(field_row.get("section_name", "")).strip() == dep_section_str and
-                        str(field_row.get("field_label", "")).strip() == dep_field_str):
-                        field_found = True
-                        # Get field options if available
-                        options_str = field_row.get("options")
-                        if options_str and str(options_str).strip():
-                            try:
-                                field_options = json.loads(str(options_str).strip())
-                            except:
-                                pass
-                        break
+                field_key = (row_data["_form_key"], dep_section_str.lower(), dep_field_str.lower())
+                field_found = field_key in fields_index
+                # Get field options if available
+                field_options = fields_index.get(field_key) or []
 
                 if not field_found:
-                    validation_errors.append({
-                        "row": actual_row,
-                        "sheet": SHEET_NAMES["sections"],
-                        "type": "Invalid Reference",
-                        "column": "Dependency Field",
-                        "invalid_value": dep_field_str,
-                        "message": f"Dependency field '{dep_field_str}' not found in section '{dep_section_str}' in Fields sheet."
-                    })
+                    validation_errors.add(
+                        row=actual_row,
+                        sheet=SHEET_NAMES["sections"],
+                        type="Invalid Reference",
+                        column="Dependency Field",
+                        invalid_value=dep_field_str,
+                        message=f"Dependency field '{dep_field_str}' not found in section '{dep_section_str}' in Fields sheet."
+                    )
                 elif field_options and dep_option_str not in field_options:
                     # Validate option exists in field's options (if options are defined)
-                    validation_errors.append({
-                        "row": actual_row,
-                        "sheet": SHEET_NAMES["sections"],
-                        "type": "Invalid Reference",
-                        "column": "Dependency Option",
-                        "invalid_value": dep_option_str,
-                        "message": f"Dependency option '{dep_option_str}' not found in field '{dep_field_str}' options: {field_options}"
-                    })
+                    validation_errors.add(
+                        row=actual_row,
+                        sheet=SHEET_NAMES["sections"],
+                        type="Invalid Reference",
+                        column="Dependency Option",
+                        invalid_value=dep_option_str,
+                        message=f"Dependency option '{dep_option_str}' not found in field '{dep_field_str}' options: {field_options}"
+                    )
 
         # 7. Validate dependency JSON format (only if simple dependency not used)
         dependency = row_data.get("dependency")
         if dependency and str(dependency).strip() and not (has_dep_section and has_dep_field and has_dep_option):
             dependency_str = str(dependency).strip()
             if not is_valid_json(dependency_str):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["sections"],
-                    "type": "Invalid Format",
-                    "column": "Dependency (JSON)",
-                    "invalid_value": dependency_str,
-                    "message": "Invalid JSON format for Dependency field."
-                })
-
-    # =========================
-    # VALIDATE FIELDS SHEET
-    # =========================
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["sections"],
+                    type="Invalid Format",
+                    column="Dependency (JSON)",
+                    invalid_value=dependency_str,
+                    message=ERROR_MESSAGES["invalid_dependency_json"]
+                )
+
+    return validation_errors
+
+
+def validate_fields_sheet(parsed_data, context):
+    """
+    Validate the Fields sheet: required data, form/section references,
+    dropdowns, type compatibility, field order, duplicates, JSON columns
+    and field dependencies.
+
+    Args:
+        parsed_data (dict): Parsed data from all sheets
+        context (dict): Shared lookups from build_validation_context()
+
+    Returns:
+        ValidationErrorLog: Errors found in the sheet
+    """
+    validation_errors = ValidationErrorLog()
+    field_types_lc = context["field_types_lc"]
+    data_types_lc = context["data_types_lc"]
+    field_type_data_type_map = context["field_type_data_type_map"]
+    form_titles_lc = context["form_titles_lc"]
+    sections_map_lc = context["sections_map_lc"]
+    fields_index = context["fields_index"]
+
+    # Track seen values for duplicate detection
+    seen_fields = set()  # (form_title, section_name, field_label)
+    seen_field_orders = set()  # (form_title, section_name, field_order)
+
+    # Display names of the required columns, resolved once per sheet
+    required_columns = {field: get_original_column_name(field) for field in REQUIRED_FIELDS["fields"]}
+
     for idx, row_data in enumerate(parsed_data.get("fields", []), start=1):
         actual_row = idx + 3
 
         # 1. Check required fields
         missing_fields = []
-        for field in REQUIRED_FIELDS["fields"]:
+        for field, column_name in required_columns.items():
             value = row_data.get(field)
             if value is None or str(value).strip() == "":
-                original_col_name = get_original_column_name(field)
-                missing_fields.append(original_col_name)
+                missing_fields.append(column_name)
 
         if missing_fields:
-            validation_errors.append({
-                "row": actual_row,
-                "sheet": SHEET_NAMES["fields"],
-                "type": "Missing Data",
-                "message": f"Missing required data in column(s): {', '.join(missing_fields)}"
-            })
+            validation_errors.add(
+                row=actual_row,
+                sheet=SHEET_NAMES["fields"],
+                type="Missing Data",
+                message=ERROR_MESSAGES["missing_data"].format(columns=", ".join(missing_fields))
+            )
 
         # 2. Validate form_title exists in Forms sheet
         form_title = row_data.get("form_title")
         if form_title and str(form_title).strip():
             form_title_str = str(form_title).strip()
-            if form_title_str not in form_titles_in_file:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Reference",
-                    "column": "Form Title",
-                    "invalid_value": form_title_str,
-                    "message": f"Form '{form_title_str}' not found in Forms sheet."
-                })
+            if row_data["_form_key"] not in form_titles_lc:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Invalid Reference",
+                    column="Form Title",
+                    invalid_value=form_title_str,
+                    message=ERROR_MESSAGES["form_not_found"].format(form_title=form_title_str)
+                )
 
         # 3. Validate section_name exists in Sections sheet for this form
         section_name = row_data.get("section_name")
@@ -744,43 +979,43 @@ def validate_all_sheets(parsed_data, user):
             form_title_str = str(form_title).strip()
             section_name_str = str(section_name).strip()
 
-            if form_title_str in sections_map:
-                if section_name_str not in sections_map[form_title_str]:
-                    validation_errors.append({
-                        "row": actual_row,
-                        "sheet": SHEET_NAMES["fields"],
-                        "type": "Invalid Reference",
-                        "column": "Section Name",
-                        "invalid_value": section_name_str,
-                        "message": f"Section '{section_name_str}' not found for form '{form_title_str}' in Sections sheet."
-                    })
+            if row_data["_form_key"] in sections_map_lc:
+                if row_data["_section_key"] not in sections_map_lc[row_data["_form_key"]]:
+                    validation_errors.add(
+                        row=actual_row,
+                        sheet=SHEET_NAMES["fields"],
+                        type="Invalid Reference",
+                        column="Section Name",
+                        invalid_value=section_name_str,
+                        message=f"Section '{section_name_str}' not found for form '{form_title_str}' in Sections sheet."
+                    )
 
         # 4. Validate dropdowns: field_type and data_type
         field_type = row_data.get("field_type")
         if field_type and str(field_type).strip():
             field_type_str = str(field_type).strip()
-            if not any(field_type_str.lower() == ft.lower() for ft in valid_field_types):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Dropdown Value",
-                    "column": "Field Type",
-                    "invalid_value": field_type_str,
-                    "message": f"'{field_type_str}' is not a valid Field Type. Must be selected from dropdown."
-                })
+            if field_type_str.lower() not in field_types_lc:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Invalid Dropdown Value",
+                    column="Field Type",
+                    invalid_value=field_type_str,
+                    message=ERROR_MESSAGES["invalid_dropdown"].format(value=field_type_str, column="Field Type")
+                )
 
         data_type = row_data.get("data_type")
         if data_type and str(data_type).strip():
             data_type_str = str(data_type).strip()
-            if not any(data_type_str.lower() == dt.lower() for dt in valid_data_types):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Dropdown Value",
-                    "column": "Data Type",
-                    "invalid_value": data_type_str,
-                    "message": f"'{data_type_str}' is not a valid Data Type. Must be selected from dropdown."
-                })
+            if data_type_str.lower() not in data_types_lc:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Invalid Dropdown Value",
+                    column="Data Type",
+                    invalid_value=data_type_str,
+                    message=ERROR_MESSAGES["invalid_dropdown"].format(value=data_type_str, column="Data Type")
+                )
 
         # 5. Validate field_type and data_type compatibility
         if field_type and data_type:
@@ -789,38 +1024,21 @@ def validate_all_sheets(parsed_data, user):
 
             expected_data_type = field_type_data_type_map.get(field_type_str)
             if expected_data_type and expected_data_type.lower() != data_type_str.lower():
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Incompatible Types",
-                    "column": "Data Type",
-                    "invalid_value": data_type_str,
-                    "message": f"Field Type '{field_type_str}' requires Data Type '{expected_data_type}', but '{data_type_str}' was provided."
-                })
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Incompatible Types",
+                    column="Data Type",
+                    invalid_value=data_type_str,
+                    message=f"Field Type '{field_type_str}' requires Data Type '{expected_data_type}', but '{data_type_str}' was provided."
+                )
 
         # 6. Validate field_order is a positive integer
         field_order = row_data.get("field_order")
-        if field_order is not None:
-            try:
-                order_int = int(field_order)
-                if order_int <= 0:
-                    validation_errors.append({
-                        "row": actual_row,
-                        "sheet": SHEET_NAMES["fields"],
-                        "type": "Invalid Format",
-                        "column": "Field Order",
-                        "invalid_value": str(field_order),
-                        "message": "Field Order must be a positive integer."
-                    })
-            except (ValueError, TypeError):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Format",
-                    "column": "Field Order",
-                    "invalid_value": str(field_order),
-                    "message": "Field Order must be a valid integer."
-                })
+        order_int = validate_positive_int(
+            field_order, validation_errors,
+            row=actual_row, sheet=SHEET_NAMES["fields"], column="Field Order"
+        )
 
         # 7. Check duplicate (form_title, section_name, field_label)
         field_label = row_data.get("field_label")
@@ -828,55 +1046,51 @@ def validate_all_sheets(parsed_data, user):
             form_title_str = str(form_title).strip()
             section_name_str = str(section_name).strip()
             field_label_str = str(field_label).strip()
-            field_key = (form_title_str.lower(), section_name_str.lower(), field_label_str.lower())
+            field_key = (row_data["_form_key"], row_data["_section_key"], row_data["_label_key"])
 
             if field_key in seen_fields:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Duplicate in File",
-                    "column": "Field Label",
-                    "invalid_value": field_label_str,
-                    "message": f"Field '{field_label_str}' appears multiple times in section '{section_name_str}' of form '{form_title_str}'."
-                })
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Duplicate in File",
+                    column="Field Label",
+                    invalid_value=field_label_str,
+                    message=f"Field '{field_label_str}' appears multiple times in section '{section_name_str}' of form '{form_title_str}'."
+                )
             else:
                 seen_fields.add(field_key)
 
         # 8. Check duplicate (form_title, section_name, field_order)
-        if form_title and section_name and field_order is not None:
+        if form_title and section_name and order_int is not None:
             form_title_str = str(form_title).strip()
             section_name_str = str(section_name).strip()
-            try:
-                order_int = int(field_order)
-                order_key = (form_title_str.lower(), section_name_str.lower(), order_int)
-
-                if order_key in seen_field_orders:
-                    validation_errors.append({
-                        "row": actual_row,
-                        "sheet": SHEET_NAMES["fields"],
-                        "type": "Duplicate in File",
-                        "column": "Field Order",
-                        "invalid_value": str(field_order),
-                        "message": f"Field Order {field_order} is used multiple times in section '{section_name_str}' of form '{form_title_str}'."
-                    })
-                else:
-                    seen_field_orders.add(order_key)
-            except (ValueError, TypeError):
-                pass  # Already handled above
+            order_key = (row_data["_form_key"], row_data["_section_key"], order_int)
+
+            if order_key in seen_field_orders:
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Duplicate in File",
+                    column="Field Order",
+                    invalid_value=str(field_order),
+                    message=f"Field Order {field_order} is used multiple times in section '{section_name_str}' of form '{form_title_str}'."
+                )
+            else:
+                seen_field_orders.add(order_key)
 
         # 9. Validate options JSON format (for dropdowns, checkboxes, etc.)
         options = row_data.get("options")
         if options and str(options).strip():
             options_str = str(options).strip()
             if not is_valid_json(options_str):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Format",
-                    "column": "Options",
-                    "invalid_value": options_str,
-                    "message": "Invalid JSON format. Expected array like: [\"Option1\",\"Option2\"]"
-                })
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Invalid Format",
+                    column="Options",
+                    invalid_value=options_str,
+                    message="Invalid JSON format. Expected array like: [\"Option1\",\"Option2\"]"
+                )
 
         # 10. Validate simple field dependency columns
         field_dep_section = row_data.get("field_dep_section")
@@ -899,12 +1113,12 @@ def validate_all_sheets(parsed_data, user):
                 missing_field_dep_cols.append("Field Dep Option")
 
             if missing_field_dep_cols:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Missing Data",
-                    "message": f"When using simple field dependency, all three columns must be filled: {', '.join(missing_field_dep_cols)}"
-                })
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Missing Data",
+                    message=f"When using simple field dependency, all three columns must be filled: {', '.join(missing_field_dep_cols)}"
+                )
             else:
                 # All three are provided - validate them
                 field_dep_section_str = str(field_dep_section).strip()
@@ -914,95 +1128,80 @@ def validate_all_sheets(parsed_data, user):
                 # Validate dependency section exists in the same form
                 if form_title:
                     form_title_str = str(form_title).strip()
-                    if form_title_str in sections_map:
-                        if field_dep_section_str not in sections_map[form_title_str]:
-                            validation_errors.append({
-                                "row": actual_row,
-                                "sheet": SHEET_NAMES["fields"],
-                                "type": "Invalid Reference",
-                                "column": "Field Dep Section",
-                                "invalid_value": field_dep_section_str,
-                                "message": f"Field dependency section '{field_dep_section_str}' not found in Sections sheet for form '{form_title_str}'."
-                            })
+                    if row_data["_form_key"] in sections_map_lc:
+                        if field_dep_section_str.lower() not in sections_map_lc[row_data["_form_key"]]:
+                            validation_errors.add(
+                                row=actual_row,
+                                sheet=SHEET_NAMES["fields"],
+                                type="Invalid Reference",
+                                column="Field Dep Section",
+                                invalid_value=field_dep_section_str,
+                                message=f"Field dependency section '{field_dep_section_str}' not found in Sections sheet for form '{form_title_str}'."
+                            )
 
                     # Validate dependency field exists in the dependency section
-                    dep_field_found = False
-                    dep_field_options = []
-                    for field_row in parsed_data.get("fields", []):
-                        if (str(field_row.get("form_title", "")).strip() == form_title_str and
-                            str(field_row.get("section_name", "")).strip() == field_dep_section_str and
-                            str(field_row.get("field_label", "")).strip() == field_dep_field_str):
-                            dep_field_found = True
-                            # Get field options if available
-                            options_str = field_row.get("options")
-                            if options_str and str(options_str).strip():
-                                try:
-                                    dep_field_options = json.loads(str(options_str).strip())
-                                except:
-                                    pass
-                            break
+                    field_key = (row_data["_form_key"], field_dep_section_str.lower(), field_dep_field_str.lower())
+                    dep_field_found = field_key in fields_index
+                    # Get field options if available
+                    dep_field_options = fields_index.get(field_key) or []
 
                     if not dep_field_found:
-                        validation_errors.append({
-                            "row": actual_row,
-                            "sheet": SHEET_NAMES["fields"],
-                            "type": "Invalid Reference",
-                            "column": "Field Dep Field",
-                            "invalid_value": field_dep_field_str,
-                            "message": f"Field dependency field '{field_dep_field_str}' not found in section '{field_dep_section_str}' in Fields sheet."
-                        })
+                        validation_errors.add(
+                            row=actual_row,
+                            sheet=SHEET_NAMES["fields"],
+                            type="Invalid Reference",
+                            column="Field Dep Field",
+                            invalid_value=field_dep_field_str,
+                            message=f"Field dependency field '{field_dep_field_str}' not found in section '{field_dep_section_str}' in Fields sheet."
+                        )
                     elif dep_field_options and field_dep_option_str not in dep_field_options:
                         # Validate option exists in field's options (if options are defined)
-                        validation_errors.append({
-                            "row": actual_row,
-                            "sheet": SHEET_NAMES["fields"],
-                            "type": "Invalid Reference",
-                            "column": "Field Dep Option",
-                            "invalid_value": field_dep_option_str,
-                            "message": f"Field dependency option '{field_dep_option_str}' not found in field '{field_dep_field_str}' options: {dep_field_options}"
-                        })
+                        validation_errors.add(
+                            row=actual_row,
+                            sheet=SHEET_NAMES["fields"],
+                            type="Invalid Reference",
+                            column="Field Dep Option",
+                            invalid_value=field_dep_option_str,
+                            message=f"Field dependency option '{field_dep_option_str}' not found in field '{field_dep_field_str}' options: {dep_field_options}"
+                        )
 
         # 11. Validate dependency JSON format (only if simple columns not used)
         dependency = row_data.get("field_dependency")
         if dependency and str(dependency).strip() and not (has_field_dep_section and has_field_dep_field and has_field_dep_option):
             dependency_str = str(dependency).strip()
             if not is_valid_json(dependency_str):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Format",
-                    "column": "Dependency",
-                    "invalid_value": dependency_str,
-                    "message": "Invalid JSON format for Dependency field."
-                })
-
-        # 11. Validate additional_info JSON format
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Invalid Format",
+                    column="Dependency",
+                    invalid_value=dependency_str,
+                    message=ERROR_MESSAGES["invalid_dependency_json"]
+                )
+
+        # 11. Validate additional_info is a JSON object
         additional_info = row_data.get("additional_info")
         if additional_info and str(additional_info).strip():
             additional_info_str = str(additional_info).strip()
-            if not is_valid_json(additional_info_str):
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Format",
-                    "column": "Additional Info",
-                    "invalid_value": additional_info_str,
-                    "message": "Invalid JSON format for Additional Info field."
-                })
+            if not is_json_object(additional_info_str):
+                if is_valid_json(additional_info_str):
+                    message = "Additional Info must be a JSON object, e.g. {\"placeholder\": \"Enter value\"}."
+                else:
+                    message = "Invalid JSON format for Additional Info field."
+                validation_errors.add(
+                    row=actual_row,
+                    sheet=SHEET_NAMES["fields"],
+                    type="Invalid Format",
+                    column="Additional Info",
+                    invalid_value=additional_info_str,
+                    message=message
+                )
 
         # 12. Validate required field (should be TRUE/FALSE or boolean)
-        required = row_data.get("required")
-        if required is not None and str(required).strip():
-            required_str = str(required).strip().upper()
-            if required_str not in ["TRUE", "FALSE", "YES", "NO", "1", "0"]:
-                validation_errors.append({
-                    "row": actual_row,
-                    "sheet": SHEET_NAMES["fields"],
-                    "type": "Invalid Format",
-                    "column": "Required",
-                    "invalid_value": str(required),
-                    "message": f"'{required}' is not a valid boolean. Use TRUE or FALSE."
-                })
+        validate_boolean(
+            row_data.get("required"), validation_errors,
+            row=actual_row, sheet=SHEET_NAMES["fields"], column="Required"
+        )
 
     return validation_errors
 
@@ -1017,28 +1216,179 @@ def get_original_column_name(normalized_field):
     Returns:
         str: Original column name (e.g., 'Form Title')
     """
-    for original, normalized in COLUMN_MAPPING.items():
-        if normalized == normalized_field:
-            return original
+    original = REVERSE_COLUMN_MAPPING.get(normalized_field)
+    if original is not None:
+        return original
     return normalized_field.replace("_", " ").title()
 
 
+@functools.lru_cache(maxsize=4096)
 def is_valid_json(json_string):
     """
     Validate if a string is valid JSON.
 
+    Parses with load_json, so orjson is used when it is installed.
+    Results are cached, since templates often repeat the same JSON
+    across many rows.
+
     Args:
         json_string (str): String to validate
 
     Returns:
         bool: True if valid JSON, False otherwise
     """
+    if not isinstance(json_string, str):
+        return False
+
     try:
-        json.loads(json_string)
+        load_json(json_string)
         return True
-    except (json.JSONDecodeError, TypeError):
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=4096)
+def is_json_object(json_string):
+    """
+    Validate if a string is a JSON object (as opposed to an array or scalar).
+
+    Args:
+        json_string (str): String to validate
+
+    Returns:
+        bool: True if the string parses to a JSON object, False otherwise
+    """
+    if not isinstance(json_string, str):
         return False
 
+    try:
+        return isinstance(load_json(json_string), dict)
+    except ValueError:
+        return False
+
+
+def parse_json_columns(row, columns):
+    """
+    Parse the JSON columns of a row.
+
+    Args:
+        row (dict): Parsed row with normalized column names
+        columns (tuple): Normalized names of the JSON columns
+
+    Returns:
+        dict: {column: parsed value} for non-empty cells holding valid JSON
+    """
+    json_values = {}
+    for column in columns:
+        value_str = clean_str(row.get(column))
+        if not value_str:
+            continue
+        try:
+            json_values[column] = load_json(value_str)
+        except ValueError:
+            pass
+    return json_values
+
+
+def parse_int(value):
+    """
+    Parse a cell value to an integer without raising.
+
+    Plain digit strings take a fast path that skips the exception
+    machinery; anything else falls back to int() conversion.
+
+    Args:
+        value: Value to parse (can be string, int, float)
+
+    Returns:
+        int or None: Parsed integer, or None if the value is not an integer
+    """
+    if isinstance(value, int):
+        return value
+
+    if isinstance(value, str):
+        value_str = value.strip()
+        if value_str.isdecimal():
+            return int(value_str)
+
+    try:
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def validate_positive_int(value, errors, *, row, sheet, column):
+    """
+    Validate that a cell holds a positive integer, recording any error.
+
+    Empty cells are not reported here; required columns are checked
+    separately.
+
+    Args:
+        value: Cell value to validate
+        errors (ValidationErrorLog): Error log to record to
+        row (int): Spreadsheet row number of the cell
+        sheet (str): Display name of the sheet
+        column (str): Display name of the column
+
+    Returns:
+        int or None: Parsed integer (even if not positive), or None if unparseable
+    """
+    order_int = parse_int(value)
+    if order_int is None:
+        if value is not None:
+            errors.add(
+                row=row,
+                sheet=sheet,
+                type="Invalid Format",
+                column=column,
+                invalid_value=str(value),
+                message=ERROR_MESSAGES["invalid_integer"].format(column=column)
+            )
+    elif order_int <= 0:
+        errors.add(
+            row=row,
+            sheet=sheet,
+            type="Invalid Format",
+            column=column,
+            invalid_value=str(value),
+            message=ERROR_MESSAGES["non_positive_integer"].format(column=column)
+        )
+    return order_int
+
+
+def validate_boolean(value, errors, *, row, sheet, column):
+    """
+    Validate that a cell holds one of the accepted boolean spellings,
+    recording any error. Empty cells are allowed.
+
+    Args:
+        value: Cell value to validate
+        errors (ValidationErrorLog): Error log to record to
+        row (int): Spreadsheet row number of the cell
+        sheet (str): Display name of the sheet
+        column (str): Display name of the column
+    """
+    # Typed cells (Excel booleans, 0/1 numbers) are valid without string work
+    if value is None or isinstance(value, bool):
+        return
+    if isinstance(value, int) and value in (0, 1):
+        return
+
+    value_str = str(value).strip()
+    if not value_str:
+        return
+
+    if len(value_str) > BOOLEAN_MAX_LENGTH or value_str.upper() not in BOOLEAN_VALUES:
+        errors.add(
+            row=row,
+            sheet=sheet,
+            type="Invalid Format",
+            column=column,
+            invalid_value=value_str,
+            message=ERROR_MESSAGES["invalid_boolean"].format(value=value_str)
+        )
+
 
 def parse_boolean(value):
     """
@@ -1057,13 +1407,72 @@ def parse_boolean(value):
         return value
 
     value_str = str(value).strip().upper()
-    return value_str in ["TRUE", "YES", "1"]
+    return value_str in TRUTHY_VALUES
+
+
+def clean_str(value, default=""):
+    """
+    Return a cell value as a stripped string.
+
+    Args:
+        value: Cell value (string, number or None)
+        default: Value returned for empty cells (default: "")
+
+    Returns:
+        str: Stripped string, or default if the cell is empty
+    """
+    if not value:
+        return default
+    value_str = value.strip() if isinstance(value, str) else str(value).strip()
+    return value_str or default
+
+
+def group_rows_by_form(rows):
+    """
+    Group sheet rows by their lowercased Form Title, keeping row order.
+
+    Args:
+        rows (list): Parsed rows from the Sections or Fields sheet
+
+    Returns:
+        dict: {lowercased form title: [rows]}
+    """
+    rows_by_form = {}
+    for row in rows:
+        rows_by_form.setdefault(row.get("_form_key", ""), []).append(row)
+    return rows_by_form
+
+
+def get_dynamic_endpoint(field_type_name, field_label):
+    """
+    Return the API endpoint for a field that should be dynamic.
+
+    A field is dynamic when its field type name or label contains one of
+    the DYNAMIC_FIELD_ENDPOINTS keywords (case-insensitive).
+
+    Args:
+        field_type_name (str): Field type name
+        field_label (str): Field label
+
+    Returns:
+        str or None: Endpoint of the first matching keyword, or None
+    """
+    field_type_lower = field_type_name.lower()
+    field_label_lower = field_label.lower()
+
+    if not (DYNAMIC_FIELD_PATTERN.search(field_type_lower) or DYNAMIC_FIELD_PATTERN.search(field_label_lower)):
+        return None
+
+    for keyword, api_endpoint in DYNAMIC_FIELD_ENDPOINTS.items():
+        if keyword in field_type_lower or keyword in field_label_lower:
+            return api_endpoint
+    return None
 
 
 def generate_unique_field_name(prefix="field"):
     """
     Generate a unique field name matching the frontend logic.
-    Uses timestamp and random string to ensure uniqueness.
+    Uses timestamp and a per-process counter to ensure uniqueness.
 
     Frontend equivalent:
     const generateUniqueName = (prefix = "field") => {
@@ -1076,20 +1485,16 @@ def generate_unique_field_name(prefix="field"):
         prefix (str): Prefix for the field name (default: "field")
 
     Returns:
-        str: Unique field name in format: {prefix}_{timestamp}_{random}
+        str: Unique field name in format: {prefix}_{timestamp}_{suffix}
     """
-    import time
-    import random
-    import string
-
     # Get current timestamp in milliseconds (like Date.now() in JavaScript)
     timestamp = int(time.time() * 1000)
 
-    # Generate random 6-character string (like Math.random().toString(36).substring(2, 8))
-    # Using lowercase letters and digits to match JS toString(36)
-    random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+    # 6-character suffix (like Math.random().toString(36).substring(2, 8)).
+    # Hex digits are a subset of the JS base-36 alphabet
+    suffix = next(FIELD_NAME_COUNTER) & 0xFFFFFF
 
-    return f"{prefix}_{timestamp}_{random_str}"
+    return f"{prefix}_{timestamp}_{suffix:06x}"
 
 
 # ===============================
@@ -1097,7 +1502,7 @@ def generate_unique_field_name(prefix="field"):
 # ===============================
 
 @transaction.atomic
-def create_single_form(form_data, parsed_data, user):
+def create_single_form(form_data, parsed_data, user, form_type_cache=None):
     """
     Create a single form with its sections and fields in an atomic transaction.
 
@@ -1105,107 +1510,98 @@ def create_single_form(form_data, parsed_data, user):
         form_data (dict): Form metadata from Forms sheet
         parsed_data (dict): All parsed data (forms, sections, fields)
         user: Current user
+        form_type_cache (dict): Optional {lowercased name: FormType} cache shared
+            across calls, so each form type is looked up only once per upload
 
     Returns:
-        dict: Result with status, message, and form_info
+        dict: Result with status, message, form_info and, on success, the
+            unsaved form_draft for the caller to bulk create
     """
     try:
-        print(f"\n>>> Entering create_single_form function")
 
-        form_title = str(form_data.get("form_title", "")).strip()
-        form_type_name = str(form_data.get("form_type", "")).strip()
-        description = str(form_data.get("description", "")).strip() if form_data.get("description") else ""
+        form_title = clean_str(form_data.get("form_title"))
+        form_type_name = clean_str(form_data.get("form_type"))
+        description = clean_str(form_data.get("description"))
         is_completed = parse_boolean(form_data.get("is_completed", False))
 
-        print(f">>> Form title: {form_title}")
-        print(f">>> Form type: {form_type_name}")
-        print(f">>> Looking up FormType...")
 
         # Get FormType
-        form_type = FormType.objects.filter(
-            name__iexact=form_type_name,
-            effective_end_date__isnull=True
-        ).first()
+        if form_type_cache is None:
+            form_type_cache = {}
+        form_type_key = form_type_name.lower()
+        if form_type_key not in form_type_cache:
+            form_type_cache[form_type_key] = FormType.objects.filter(
+                name__iexact=form_type_name,
+                effective_end_date__isnull=True
+            ).first()
+        form_type = form_type_cache[form_type_key]
 
         if not form_type:
-            print(f">>> ERROR: FormType '{form_type_name}' not found")
+            logger.debug("FormType '%s' not found", form_type_name)
             return {
                 "status": "failed",
                 "message": f"Form '{form_title}': Form Type '{form_type_name}' not found."
             }
 
-        print(f">>> FormType found: {form_type.name} (ID: {form_type.id})")
-        print(f">>> Creating Form object...")
 
-        # Create Form
-        form = Form.objects.create(
+        # Create Form with root_form set to itself (first version). The UUID
+        # primary key is assigned on instantiation, so a single INSERT suffices.
+        form = Form(
             title=form_title,
             form_type=form_type,
             description=description,
             is_completed=is_completed,
             created_by=user,
-            root_form=None  # Will be set to itself after creation
         )
-
-        print(f">>> Form created: {form.id}")
-
-        # Set root_form to itself (first version)
         form.root_form = form
         form.save()
-        print(f">>> root_form set to itself")
 
-        # Get sections for this form
-        form_sections = [
-            s for s in parsed_data.get("sections", [])
-            if str(s.get("form_title", "")).strip().lower() == form_title.lower()
-        ]
 
-        # Get fields for this form
-        form_fields = [
-            f for f in parsed_data.get("fields", [])
-            if str(f.get("form_title", "")).strip().lower() == form_title.lower()
-        ]
+        # Get sections and fields for this form, grouped by the caller when
+        # several forms are created from the same upload
+        sections_by_form = parsed_data.get("sections_by_form")
+        if sections_by_form is None:
+            sections_by_form = group_rows_by_form(parsed_data.get("sections", []))
+        fields_by_form = parsed_data.get("fields_by_form")
+        if fields_by_form is None:
+            fields_by_form = group_rows_by_form(parsed_data.get("fields", []))
+
+        form_sections = sections_by_form.get(form_title.lower(), [])
+        form_fields = fields_by_form.get(form_title.lower(), [])
 
         # Debug output
-        print(f"\n=== Creating form '{form_title}' ===")
-        print(f"Found {len(form_sections)} sections")
-        print(f"Found {len(form_fields)} fields")
-        print(f"All sections in parsed_data: {len(parsed_data.get('sections', []))}")
-        print(f"All fields in parsed_data: {len(parsed_data.get('fields', []))}")
+        logger.debug("Creating form '%s' with %d sections and %d fields",
+                     form_title, len(form_sections), len(form_fields))
+
+        # Index field rows by (section, label) for dependency lookups; first row wins
+        field_rows_by_label = {}
+        for field_row in form_fields:
+            field_rows_by_label.setdefault((field_row["_section_key"], field_row["_label_key"]), field_row)
 
         # Create sections
         section_map = {}  # Maps section_name to FormSections object
-        sections_created = 0
+        sections_to_create = []
 
         for section_data in form_sections:
-            section_name = str(section_data.get("section_name", "")).strip()
-            section_description = str(section_data.get("section_description", "")).strip() if section_data.get("section_description") else ""
+            section_name = clean_str(section_data.get("section_name"))
+            section_description = clean_str(section_data.get("section_description"))
             section_order = int(section_data.get("section_order", 1))
 
             # Get simple dependency columns
-            dep_section = str(section_data.get("dependency_section", "")).strip() if section_data.get("dependency_section") else None
-            dep_field = str(section_data.get("dependency_field", "")).strip() if section_data.get("dependency_field") else None
-            dep_option = str(section_data.get("dependency_option", "")).strip() if section_data.get("dependency_option") else None
-
-            # Get JSON dependency column
-            dependency_str = str(section_data.get("dependency", "")).strip() if section_data.get("dependency") else None
-
-            print(f"Creating section: {section_name}, order: {section_order}")
+            dep_section = clean_str(section_data.get("dependency_section"), None)
+            dep_field = clean_str(section_data.get("dependency_field"), None)
+            dep_option = clean_str(section_data.get("dependency_option"), None)
 
             dependency = None
 
             # Priority 1: Use simple dependency columns if all three are provided
             if dep_section and dep_field and dep_option:
-                print(f"Building dependency from simple columns: Section={dep_section}, Field={dep_field}, Option={dep_option}")
-
                 # Find the field in the parsed data to get its field_name
                 field_name_to_use = None
-                for field in form_fields:
-                    if (str(field.get("section_name", "")).strip().lower() == dep_section.lower() and
-                        str(field.get("field_label", "")).strip().lower() == dep_field.lower()):
-                        # Use the actual field_name from Excel (not the label)
-                        field_name_to_use = field.get("field_name", "")
-                        break
+                dep_field_row = field_rows_by_label.get((dep_section.lower(), dep_field.lower()))
+                if dep_field_row is not None:
+                    # Use the actual field_name from Excel (not the label)
+                    field_name_to_use = dep_field_row.get("field_name", "")
 
                 if not field_name_to_use:
                     # If field not found in current form, use the provided field label as fallback
@@ -1226,31 +1622,49 @@ def create_single_form(form_data, parsed_data, user):
                         }
                     ]
                 }
-                print(f"Generated dependency JSON: {dependency}")
 
-            # Priority 2: Use JSON dependency if provided and simple columns not used
-            elif dependency_str:
-                try:
-                    dependency = json.loads(dependency_str)
-                except json.JSONDecodeError:
-                    dependency = None
+            # Priority 2: Use JSON dependency (parsed at ingest) if simple columns not used
+            else:
+                dependency = section_data["_json"].get("dependency")
 
-            section = FormSections.objects.create(
+            section = FormSections(
                 form=form,
                 name=section_name,
                 description=section_description,
                 order=section_order,
                 dependency=dependency
             )
+            sections_to_create.append(section)
+            section_map[section_data["_section_key"]] = section
+
+        # Reject the form up front if any field refers to an unknown section
+        # (normally caught in validation); the form row is rolled back
+        unknown_sections = {f["_section_key"] for f in form_fields}.difference(section_map)
+        if unknown_sections:
+            transaction.set_rollback(True)
+            return {
+                "status": "failed",
+                "message": f"Form '{form_title}': Unknown section(s) "
+                           f"{', '.join(sorted(unknown_sections))} referenced in Fields sheet."
+            }
 
-            print(f"Section created successfully: {section.id}")
-
-            section_map[section_name.lower()] = section
-            sections_created += 1
+        # Insert all sections in one query
+        FormSections.objects.bulk_create(sections_to_create, batch_size=BULK_BATCH_SIZE)
+        sections_created = len(sections_to_create)
 
         # Create fields
-        fields_created = 0
         parent_field_map = {}  # Maps (section, field_label) to FormFields object
+        field_names_map = {}  # Maps (section_id, field_name) to FormFields object
+        fields_to_create = []
+
+        # Fetch all FieldTypes used by this form in one query (uses is_deleted for soft delete)
+        field_type_names = {clean_str(f.get("field_type")).lower() for f in form_fields}
+        field_type_map = {
+            ft.name_lc: ft for ft in
+            FieldType.objects.annotate(name_lc=Lower("name"))
+            .filter(name_lc__in=field_type_names, is_deleted=False)
+            .select_related("data_type")
+        }
 
         # Sort fields to ensure parent fields are created before children
         sorted_fields = sorted(
@@ -1259,55 +1673,38 @@ def create_single_form(form_data, parsed_data, user):
         )
 
         for field_data in sorted_fields:
-            section_name = str(field_data.get("section_name", "")).strip()
-            field_label = str(field_data.get("field_label", "")).strip()
-            field_type_name = str(field_data.get("field_type", "")).strip()
+            section_name = clean_str(field_data.get("section_name"))
+            field_label = clean_str(field_data.get("field_label"))
+            field_type_name = clean_str(field_data.get("field_type"))
             required = parse_boolean(field_data.get("required", False))
             field_order = int(field_data.get("field_order", 1))
 
             # Auto-generate unique field name (matching frontend logic)
             field_name = generate_unique_field_name()
 
-            print(f"Creating field: {field_label} (name: {field_name}) in section: {section_name}")
 
-            # Get section
-            section = section_map.get(section_name.lower())
-            if not section:
-                print(f"ERROR: Section '{section_name}' not found in section_map")
-                print(f"Available sections: {list(section_map.keys())}")
-                continue  # Skip if section not found (should be caught in validation)
+            # Get section (existence checked above)
+            section = section_map[field_data["_section_key"]]
 
-            # Get FieldType (uses is_deleted for soft delete)
-            field_type = FieldType.objects.filter(
-                name__iexact=field_type_name,
-                is_deleted=False
-            ).first()
+            # Get FieldType
+            field_type = field_type_map.get(field_type_name.lower())
 
             if not field_type:
-                print(f"ERROR: FieldType '{field_type_name}' not found")
+                logger.debug("FieldType '%s' not found for field '%s'", field_type_name, field_label)
                 continue  # Skip if field type not found
 
-            # Parse additional_info
-            additional_info_str = str(field_data.get("additional_info", "")).strip() if field_data.get("additional_info") else None
-            additional_info = {}
+            # JSON columns were parsed once at ingest
+            json_values = field_data["_json"]
 
-            if additional_info_str:
-                try:
-                    additional_info = json.loads(additional_info_str)
-                except json.JSONDecodeError:
-                    additional_info = {}
+            # Start from additional_info (copied, as it is extended below)
+            additional_info = dict(json_values.get("additional_info") or {})
 
-            # Parse options and add to additional_info
-            options_str = str(field_data.get("options", "")).strip() if field_data.get("options") else None
-            if options_str:
-                try:
-                    options = json.loads(options_str)
-                    additional_info["options"] = options
-                except json.JSONDecodeError:
-                    pass
+            # Add options to additional_info
+            if "options" in json_values:
+                additional_info["options"] = json_values["options"]
 
             # Parse width and add to additional_info (default to "100" if not provided)
-            width_str = str(field_data.get("width", "")).strip() if field_data.get("width") else None
+            width_str = clean_str(field_data.get("width"), None)
             if width_str:
                 # Extract numeric part from format like "25% (1/4)" or "100% (Full)"
                 # Split by '%' and take the first part
@@ -1316,50 +1713,26 @@ def create_single_form(form_data, parsed_data, user):
             else:
                 additional_info["width"] = "100"  # Default to 100% width
 
-            # Parse validation rules and add to additional_info
-            validation_str = str(field_data.get("validation", "")).strip() if field_data.get("validation") else None
-            if validation_str:
-                try:
-                    validation = json.loads(validation_str)
-                    additional_info["validation"] = validation
-                    print(f"Added validation rules for field '{field_label}': {validation}")
-                except json.JSONDecodeError:
-                    print(f"Warning: Invalid JSON in Validation column for field '{field_label}': {validation_str}")
+            # Add validation rules to additional_info
+            if "validation" in json_values:
+                additional_info["validation"] = json_values["validation"]
 
             # Auto-configure dynamic fields based on field type name or label
-            field_type_lower = field_type.name.lower()
-            field_label_lower = field_label.lower()
-
-            # Define common dynamic field mappings
-            dynamic_mappings = {
-                "location": "/api/config/locations/",
-                "department": "/api/config/departments/",
-                "designation": "/api/config/designations/",
-                "role": "/api/config/roles/",
-                "employee": "/api/config/employees/list/",
-                "user": "/api/config/employees/list/",
-            }
-
-            # Check if this field should be dynamic based on its name or label
-            for keyword, api_endpoint in dynamic_mappings.items():
-                if keyword in field_type_lower or keyword in field_label_lower:
-                    # Store dynamic configuration in additional_info
-                    additional_info["dynamic"] = True
-                    additional_info["end_point"] = api_endpoint
-                    print(f"Auto-configured field '{field_label}' as dynamic with endpoint: {api_endpoint}")
-                    break
+            api_endpoint = get_dynamic_endpoint(field_type.name, field_label)
+            if api_endpoint:
+                # Store dynamic configuration in additional_info
+                additional_info["dynamic"] = True
+                additional_info["end_point"] = api_endpoint
 
             # Parse field dependency - Priority 1: Simple columns, Priority 2: JSON
-            field_dep_section = str(field_data.get("field_dep_section", "")).strip() if field_data.get("field_dep_section") else None
-            field_dep_field = str(field_data.get("field_dep_field", "")).strip() if field_data.get("field_dep_field") else None
-            field_dep_option = str(field_data.get("field_dep_option", "")).strip() if field_data.get("field_dep_option") else None
+            field_dep_section = clean_str(field_data.get("field_dep_section"), None)
+            field_dep_field = clean_str(field_data.get("field_dep_field"), None)
+            field_dep_option = clean_str(field_data.get("field_dep_option"), None)
 
             dependency = None
 
             # Priority 1: Use simple field dependency columns if all three are provided
             if field_dep_section and field_dep_field and field_dep_option:
-                print(f"Building field dependency from simple columns: Section={field_dep_section}, Field={field_dep_field}, Option={field_dep_option}")
-
                 # Build the dependency JSON structure (field_name will be updated after all fields are created)
                 dependency = {
                     "field_name": field_dep_field,  # Will be updated with actual field name after creation
@@ -1374,26 +1747,19 @@ def create_single_form(form_data, parsed_data, user):
                         }
                     ]
                 }
-                print(f"Generated field dependency JSON: {dependency}")
 
-            # Priority 2: Use JSON dependency if provided and simple columns not used
+            # Priority 2: Use JSON dependency (parsed at ingest) if simple columns not used
             else:
-                dependency_str = str(field_data.get("field_dependency", "")).strip() if field_data.get("field_dependency") else None
-                if dependency_str:
-                    try:
-                        dependency = json.loads(dependency_str)
-                    except json.JSONDecodeError:
-                        dependency = None
+                dependency = json_values.get("field_dependency")
 
             # Get parent field if specified
             parent_field = None
-            parent_field_label = str(field_data.get("parent_field", "")).strip() if field_data.get("parent_field") else None
-            if parent_field_label:
-                parent_key = (section_name.lower(), parent_field_label.lower())
+            if field_data.get("_parent_key"):
+                parent_key = (field_data["_section_key"], field_data["_parent_key"])
                 parent_field = parent_field_map.get(parent_key)
 
-            # Create field
-            field = FormFields.objects.create(
+            # Build field; all fields are inserted together once built
+            field = FormFields(
                 label=field_label,
                 name=field_name,
                 field_type=field_type,
@@ -1404,21 +1770,29 @@ def create_single_form(form_data, parsed_data, user):
                 parent_field=parent_field,
                 dependency=dependency
             )
-
-            print(f"Field created successfully: {field.id}")
+            fields_to_create.append(field)
 
             # Store in map for parent field lookup
-            field_key = (section_name.lower(), field_label.lower())
+            field_key = (field_data["_section_key"], field_data["_label_key"])
             parent_field_map[field_key] = field
-            fields_created += 1
+            field_names_map[(section.id, field_name)] = field
+
+        # Insert top-level fields first, then nested fields that reference them.
+        # Primary keys are assigned in Python, so parents can be linked before insert.
+        root_fields = [f for f in fields_to_create if f.parent_field is None]
+        child_fields = [f for f in fields_to_create if f.parent_field is not None]
+        FormFields.objects.bulk_create(root_fields, batch_size=BULK_BATCH_SIZE)
+        if child_fields:
+            FormFields.objects.bulk_create(child_fields, batch_size=BULK_BATCH_SIZE)
+        fields_created = len(fields_to_create)
 
         # ==========================================
         # UPDATE SECTION DEPENDENCIES WITH ACTUAL FIELD NAMES
         # ==========================================
         # Now that all fields are created, update section dependencies to use actual field names
         # instead of the temporary field labels
-        print("\n>>> Updating section dependencies with actual field names...")
-        for section in FormSections.objects.filter(form=form, is_deleted=False):
+        updated_sections = []
+        for section in sections_to_create:
             if section.dependency and section.dependency.get("field_name"):
                 dependency_updated = False
                 dep = section.dependency.copy()
@@ -1434,18 +1808,9 @@ def create_single_form(form_data, parsed_data, user):
 
                     # If not found by label, try to find by actual field name
                     if not actual_field:
-                        dep_section = FormSections.objects.filter(
-                            form=form,
-                            name=dep_section_name,
-                            is_deleted=False
-                        ).first()
-
+                        dep_section = section_map.get(dep_section_name.lower())
                         if dep_section:
-                            actual_field = FormFields.objects.filter(
-                                section=dep_section,
-                                name=field_identifier,
-                                is_deleted=False
-                            ).first()
+                            actual_field = field_names_map.get((dep_section.id, field_identifier))
 
                     if actual_field and actual_field.name != field_identifier:
                         # Update field_name to use the actual field's NAME (from FormFields.name)
@@ -1465,72 +1830,66 @@ def create_single_form(form_data, parsed_data, user):
                                     multi_dep["field_name"] = actual_field.name
 
                         section.dependency = dep
-                        section.save()
+                        updated_sections.append(section)
                         dependency_updated = True
-                        print(f">>> Updated section '{section.name}' dependency to use field name: {actual_field.name}")
 
                 if not dependency_updated:
-                    print(f">>> Section '{section.name}' dependency not updated (field not found or no dependency)")
+                    logger.debug("Section '%s' dependency not updated (field not found)", section.name)
+
+        if updated_sections:
+            FormSections.objects.bulk_update(updated_sections, ["dependency"], batch_size=BULK_BATCH_SIZE)
 
         # ==========================================
         # UPDATE FIELD DEPENDENCIES WITH ACTUAL FIELD NAMES
         # ==========================================
         # Now that all fields are created, update field dependencies to use actual field names
         # instead of the temporary field labels
-        print("\n>>> Updating field dependencies with actual field names...")
-        for section in FormSections.objects.filter(form=form, is_deleted=False):
-            for field in FormFields.objects.filter(section=section, is_deleted=False):
-                if field.dependency and field.dependency.get("field_name"):
-                    field_dep_updated = False
-                    dep = field.dependency.copy()
-
-                    # Get the field identifier from dependency (could be name or label)
-                    field_identifier = dep.get("field_name", "")
-                    dep_section_name = dep.get("field_section", "")
-
-                    if field_identifier and dep_section_name:
-                        # Try to find the dependency field by label first (most common case for bulk upload)
-                        field_key = (dep_section_name.lower(), field_identifier.lower())
-                        actual_dep_field = parent_field_map.get(field_key)
-
-                        # If not found by label, try to find by actual field name
-                        if not actual_dep_field:
-                            dep_section = FormSections.objects.filter(
-                                form=form,
-                                name=dep_section_name,
-                                is_deleted=False
-                            ).first()
-
-                            if dep_section:
-                                actual_dep_field = FormFields.objects.filter(
-                                    section=dep_section,
-                                    name=field_identifier,
-                                    is_deleted=False
-                                ).first()
-
-                        if actual_dep_field and actual_dep_field.name != field_identifier:
-                            # Update field_name to use the actual field's NAME (from FormFields.name)
-                            dep["field_name"] = actual_dep_field.name
-
-                            # Update cascader_selection
-                            if dep.get("cascader_selection"):
-                                for cascader in dep["cascader_selection"]:
-                                    if len(cascader) >= 2 and cascader[1] == field_identifier:
-                                        cascader[1] = actual_dep_field.name
-
-                            # Update multiple_field_dependencies
-                            if dep.get("multiple_field_dependencies"):
-                                for multi_dep in dep["multiple_field_dependencies"]:
-                                    if multi_dep.get("field_name") == field_identifier:
-                                        multi_dep["field_name"] = actual_dep_field.name
-
-                            field.dependency = dep
-                            field.save()
-                            field_dep_updated = True
-                            print(f">>> Updated field '{field.label}' dependency to use field name: {actual_dep_field.name}")
-
-                    if not field_dep_updated and field.dependency:
-                        print(f">>> Field '{field.label}' dependency not updated (dependency field not found)")
+        updated_fields = []
+        for field in fields_to_create:
+            if field.dependency and field.dependency.get("field_name"):
+                field_dep_updated = False
+                dep = field.dependency.copy()
+
+                # Get the field identifier from dependency (could be name or label)
+                field_identifier = dep.get("field_name", "")
+                dep_section_name = dep.get("field_section", "")
+
+                if field_identifier and dep_section_name:
+                    # Try to find the dependency field by label first (most common case for bulk upload)
+                    field_key = (dep_section_name.lower(), field_identifier.lower())
+                    actual_dep_field = parent_field_map.get(field_key)
+
+                    # If not found by label, try to find by actual field name
+                    if not actual_dep_field:
+                        dep_section = section_map.get(dep_section_name.lower())
+                        if dep_section:
+                            actual_dep_field = field_names_map.get((dep_section.id, field_identifier))
+
+                    if actual_dep_field and actual_dep_field.name != field_identifier:
+                        # Update field_name to use the actual field's NAME (from FormFields.name)
+                        dep["field_name"] = actual_dep_field.name
+
+                        # Update cascader_selection
+                        if dep.get("cascader_selection"):
+                            for cascader in dep["cascader_selection"]:
+                                if len(cascader) >= 2 and cascader[1] == field_identifier:
+                                    cascader[1] = actual_dep_field.name
+
+                        # Update multiple_field_dependencies
+                        if dep.get("multiple_field_dependencies"):
+                            for multi_dep in dep["multiple_field_dependencies"]:
+                                if multi_dep.get("field_name") == field_identifier:
+                                    multi_dep["field_name"] = actual_dep_field.name
+
+                        field.dependency = dep
+                        updated_fields.append(field)
+                        field_dep_updated = True
+
+                if not field_dep_updated and field.dependency:
+                    logger.debug("Field '%s' dependency not updated (dependency field not found)", field.label)
+
+        if updated_fields:
+            FormFields.objects.bulk_update(updated_fields, ["dependency"], batch_size=BULK_BATCH_SIZE)
 
         # Build draft_data structure matching frontend format
         draft_data = {
@@ -1544,11 +1903,19 @@ def create_single_form(form_data, parsed_data, user):
             }
         }
 
-        # Get all sections with their fields from database
-        for section in FormSections.objects.filter(form=form).order_by('order'):
+        # Timestamp-based identifiers: one clock read, then incremented per
+        # section/field so identifiers stay unique within the same millisecond
+        draft_ids = itertools.count(int(time.time() * 1000))
+
+        # Group the created fields by section to build the draft from memory
+        fields_by_section = {}
+        for field in fields_to_create:
+            fields_by_section.setdefault(field.section_id, []).append(field)
+
+        # Walk the sections created above with their fields, in display order
+        for section in sorted(sections_to_create, key=lambda s: s.order):
             # Generate section_id using timestamp-based unique identifier
-            import time
-            section_id = f"section_{int(time.time() * 1000)}_{str(section.id)[:8]}"
+            section_id = f"section_{next(draft_ids)}_{str(section.id)[:8]}"
 
             section_data = {
                 "section_id": section_id,
@@ -1564,74 +1931,39 @@ def create_single_form(form_data, parsed_data, user):
             }
 
             # Get all fields for this section
-            for field in FormFields.objects.filter(section=section).order_by('order'):
+            for field in sorted(fields_by_section.get(section.id, []), key=lambda f: f.order):
                 # Generate field name using timestamp-based unique identifier
-                field_name = f"field_{int(time.time() * 1000)}_{str(field.id)[:8]}"
-
-                # Determine if field is dynamic and get endpoint
-                is_dynamic = field.field_type.dynamic if field.field_type else False
-                endpoint = field.field_type.endpoint if (field.field_type and field.field_type.dynamic) else None
-
-                # Auto-configure dynamic fields based on field type name or label
-                field_type_lower = field.field_type.name.lower()
-                field_label_lower = field.label.lower()
-
-                # Define common dynamic field mappings
-                dynamic_mappings = {
-                    "location": "/api/config/locations/",
-                    "department": "/api/config/departments/",
-                    "designation": "/api/config/designations/",
-                    "role": "/api/config/roles/",
-                    "employee": "/api/config/employees/list/",
-                    "user": "/api/config/employees/list/",
-                }
-
-                # Check if this field should be dynamic based on its name or label
-                for keyword, api_endpoint in dynamic_mappings.items():
-                    if keyword in field_type_lower or keyword in field_label_lower:
-                        is_dynamic = True
-                        endpoint = api_endpoint
-                        break
+                field_name = f"field_{next(draft_ids)}_{str(field.id)[:8]}"
+
+                # Determine if field is dynamic and get endpoint. Keyword-based
+                # dynamic fields were already configured in additional_info above.
+                field_additional_info = field.additional_info or {}
+                is_dynamic = field_additional_info.get("dynamic", field.field_type.dynamic)
+                endpoint = field_additional_info.get(
+                    "end_point", field.field_type.endpoint if field.field_type.dynamic else None
+                )
 
                 # Extract options from additional_info
-                options = field.additional_info.get("options", []) if field.additional_info else []
-
-                # Build validation object based on data type
-                validation = {}
-                if field.field_type.data_type.name == "select":
-                    validation = {
-                        "isMultiple": field.additional_info.get("isMultiple", False) if field.additional_info else False,
-                        "maxSelection": field.additional_info.get("maxSelection", "") if field.additional_info else "",
-                        "minSelection": 1 if field.required else 0
-                    }
-                elif field.field_type.data_type.name == "text":
-                    validation = {
-                        "pattern": field.additional_info.get("pattern", "") if field.additional_info else "",
-                        "maxLength": field.additional_info.get("maxLength", "") if field.additional_info else "",
-                        "minLength": field.additional_info.get("minLength", 0) if field.additional_info else 0
-                    }
-                elif field.field_type.data_type.name == "number":
-                    validation = {
-                        "min": field.additional_info.get("min", "") if field.additional_info else "",
-                        "max": field.additional_info.get("max", "") if field.additional_info else ""
-                    }
-                elif field.field_type.data_type.name == "file":
-                    validation = {
-                        "fileType": field.additional_info.get("fileType", "") if field.additional_info else "",
-                        "isMultiple": field.additional_info.get("isMultiple", False) if field.additional_info else False,
-                        "maxFileSize": field.additional_info.get("maxFileSize", "") if field.additional_info else ""
-                    }
-                elif field.field_type.data_type.name == "date":
-                    validation = {
-                        "startDateBeforeOrEqualEndDate": True
-                    }
+                options = field_additional_info.get("options", [])
+
+                # Build validation object based on data type: template keys
+                # take their value from additional_info when present
+                data_type_name = field.field_type.data_type.name
+                validation = {
+                    key: field_additional_info.get(key, default)
+                    for key, default in VALIDATION_TEMPLATES.get(data_type_name, {}).items()
+                }
+                if data_type_name == "select":
+                    validation["minSelection"] = 1 if field.required else 0
+                elif data_type_name == "date":
+                    validation["startDateBeforeOrEqualEndDate"] = True
 
                 field_data = {
                     "name": field_name,
-                    "type": field.field_type.data_type.name,
+                    "type": data_type_name,
                     "label": field.label,
                     "value": None,
-                    "width": field.additional_info.get("width", "100") if field.additional_info else "100",
+                    "width": field_additional_info.get("width", "100"),
                     "fields": [],  # For nested fields
                     "dynamic": is_dynamic,
                     "options": options,
@@ -1652,23 +1984,16 @@ def create_single_form(form_data, parsed_data, user):
 
             draft_data["sections"].append(section_data)
 
-        # Create FormDraft with populated data
-        print(f">>> Creating FormDraft with form structure...")
-        FormDraft.objects.create(
-            form=form,
-            draft_data=draft_data
-        )
-        print(f">>> FormDraft created with {len(draft_data['sections'])} sections")
+        # Build FormDraft with populated data; the caller saves drafts in bulk
+        form_draft = FormDraft(form=form, draft_data=draft_data)
 
-        print(f"\n=== Form Creation Summary ===")
-        print(f"Form: {form.title} (ID: {form.id})")
-        print(f"Sections created: {sections_created}")
-        print(f"Fields created: {fields_created}")
-        print(f"FormDraft created: Yes")
+        logger.debug("Created form '%s' (%s) with %d sections and %d fields",
+                     form.title, form.id, sections_created, fields_created)
 
         return {
             "status": "success",
             "message": f"Form '{form_title}' created with {sections_created} sections and {fields_created} fields.",
+            "form_draft": form_draft,
             "form_info": {
                 "id": str(form.id),
                 "unique_code": form.unique_code,
@@ -1679,12 +2004,10 @@ def create_single_form(form_data, parsed_data, user):
         }
 
     except Exception as e:
-        import traceback
-        print(f"\n>>> EXCEPTION in create_single_form:")
-        print(f">>> Error: {str(e)}")
-        print(f">>> Traceback:")
-        traceback.print_exc()
         logger.exception(f"Error creating form '{form_title}': {e}")
+        # The error is handled here, so roll back this form's savepoint
+        # explicitly; otherwise its partial rows would be committed
+        transaction.set_rollback(True)
         return {
             "status": "failed",
             "message": f"Form '{form_title}': Error - {str(e)}"
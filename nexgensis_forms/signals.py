@@ -0,0 +1,71 @@
+"""
+Signal handlers for Nexgensis Forms.
+
+Keeps cached reference data (form types, field types, data types) in step
+with the database, and cached settings in step with runtime changes.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import FormType, FieldType, DataType
+from .utils import get_user_timezone
+
+
+# Cache key holding the version of the reference data used by the bulk
+# upload template; replaced with a new value whenever a reference row changes
+REFERENCE_DATA_VERSION_KEY = "nexgensis_forms:reference_data_version"
+
+# Seconds before the version key expires and is replaced. Bounds how long
+# cached reference data can be stale when a change sends no signal (e.g.
+# QuerySet.update()) or the cache is not shared between worker processes.
+REFERENCE_DATA_VERSION_TIMEOUT = 60
+
+
+def get_reference_data_version():
+    """
+    Get the current version of the reference data.
+
+    Returns:
+        int: Version; a fresh one is stored if the key is missing or expired
+    """
+    return cache.get_or_set(
+        REFERENCE_DATA_VERSION_KEY, time.time_ns, REFERENCE_DATA_VERSION_TIMEOUT
+    )
+
+
+def set_reference_data_version():
+    """
+    Store a new reference data version.
+    """
+    # Timestamps rather than a counter, so an evicted key can never
+    # reintroduce a version that is already cached
+    cache.set(REFERENCE_DATA_VERSION_KEY, time.time_ns(), REFERENCE_DATA_VERSION_TIMEOUT)
+
+
+@receiver([post_save, post_delete], sender=FormType)
+@receiver([post_save, post_delete], sender=FieldType)
+@receiver([post_save, post_delete], sender=DataType)
+def bump_reference_data_version(sender, using=None, **kwargs):
+    """
+    Invalidate cached reference data when a FormType, FieldType or DataType
+    is saved or deleted.
+
+    The version is replaced once the transaction commits, so a concurrent
+    request cannot cache the pre-commit lists under the new version.
+    """
+    transaction.on_commit(set_reference_data_version, using=using)
+
+
+@receiver(setting_changed)
+def clear_user_timezone(setting, **kwargs):
+    """
+    Drop the cached user timezone when TIME_ZONE changes (e.g. override_settings).
+    """
+    if setting == "TIME_ZONE":
+        get_user_timezone.cache_clear()
@@ -5,18 +5,48 @@ Includes response formatting, validation, and datetime helpers.
 """
 
 from rest_framework.response import Response
-from django.utils.timezone import localtime
+from django.utils.timezone import get_current_timezone
+from django.core.exceptions import ValidationError
+from django.core.validators import EmailValidator
+import logging
+import time
 import uuid
 import re
-import pytz
 from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 from tzlocal import get_localzone
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
 
 # ==================== API Response Formatting ====================
 
+# Last formatted response timestamp: (epoch second, timezone, formatted string)
+_timestamp_cache = (None, None, "")
+
+
+def get_response_timestamp():
+    """
+    Return the current local time as 'YYYY-MM-DD HH:MM:SS'.
+
+    The formatted string is reused for calls within the same second and
+    active timezone.
+
+    Returns:
+        str: Formatted current datetime
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    time_zone = get_current_timezone()
+    cached_second, cached_time_zone, timestamp = _timestamp_cache
+    if second != cached_second or time_zone is not cached_time_zone:
+        timestamp = datetime.fromtimestamp(second, tz=time_zone).strftime('%Y-%m-%d %H:%M:%S')
+        _timestamp_cache = (second, time_zone, timestamp)
+    return timestamp
+
+
 def api_response(data=None, message="", status_code=200, errors=None, pagination=None):
     """
     Standardized API response wrapper for consistent response format.
@@ -34,12 +64,17 @@ def api_response(data=None, message="", status_code=200, errors=None, pagination
     Usage:
         return api_response(data={'id': 1}, message="Form created successfully")
         return api_response(message="Validation error", errors={'name': 'Required'}, status_code=400)
+        return api_response(status_code=204)  # empty body, no envelope
     """
+    # 204 No Content and 304 Not Modified responses carry no body
+    if status_code in (204, 304):
+        return Response(status=status_code)
+
     response_data = {
         "status": "success" if status_code < 400 else "failed",
         "message": message,
         "data": data,
-        "timestamp": localtime().strftime('%Y-%m-%d %H:%M:%S')
+        "timestamp": get_response_timestamp()
     }
 
     if pagination:
@@ -53,6 +88,17 @@ def api_response(data=None, message="", status_code=200, errors=None, pagination
 
 # ==================== Validation Functions ====================
 
+# Patterns used by the validators below, compiled once at import
+NAME_PATTERN = re.compile(r'^[A-Za-z\s]+$')
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Django's email validator, shared by all validate_email calls
+EMAIL_VALIDATOR = EmailValidator()
+
+# Boolean strings accepted by validate_bool_value
+BOOL_STRING_VALUES = frozenset(('true', 'false', 'False', 'True'))
+
+
 def validate_id(id_value):
     """
     Validate that a value is a valid UUID.
@@ -63,8 +109,17 @@ def validate_id(id_value):
     Returns:
         bool: True if valid UUID, False otherwise
     """
+    if isinstance(id_value, uuid.UUID):
+        return True
+
+    # A UUID string has at least 32 hex digits; reject shorter values (ids,
+    # names, empty strings) without going through the exception path
+    id_str = str(id_value)
+    if len(id_str) < 32:
+        return False
+
     try:
-        uuid.UUID(str(id_value))
+        uuid.UUID(id_str)
         return True
     except (ValueError, TypeError):
         return False
@@ -80,8 +135,7 @@ def validate_name(name):
     Returns:
         bool: True if valid, False otherwise
     """
-    pattern = r'^[A-Za-z\s]+$'
-    return bool(re.match(pattern, name))
+    return NAME_PATTERN.match(name) is not None
 
 
 def validate_email(email):
@@ -94,8 +148,11 @@ def validate_email(email):
     Returns:
         bool: True if valid email format, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    try:
+        EMAIL_VALIDATOR(email)
+        return True
+    except ValidationError:
+        return False
 
 
 def validate_date(date_string):
@@ -108,8 +165,7 @@ def validate_date(date_string):
     Returns:
         bool: True if valid format, False otherwise
     """
-    pattern = r"\d{4}-\d{2}-\d{2}"
-    return bool(re.findall(pattern, date_string))
+    return DATE_PATTERN.search(date_string) is not None
 
 
 def validate_bool_value(value):
@@ -122,11 +178,57 @@ def validate_bool_value(value):
     Returns:
         bool: True if valid boolean string, False otherwise
     """
-    return value in ('true', 'false', 'False', 'True')
+    # Only strings can match; this also keeps unhashable values out of the set lookup
+    return isinstance(value, str) and value in BOOL_STRING_VALUES
 
 
 # ==================== Datetime Utilities ====================
 
+@lru_cache(maxsize=1)
+def get_system_timezone():
+    """
+    Return the system timezone, looked up once per process.
+
+    Returns:
+        tzinfo: System timezone, or Asia/Kolkata if it cannot be determined
+    """
+    try:
+        return get_localzone()
+    except Exception as e:
+        logger.warning("Error fetching system timezone, defaulting to Asia/Kolkata: %s", e)
+        return ZoneInfo("Asia/Kolkata")
+
+
+@lru_cache(maxsize=16)
+def get_timezone(time_zone):
+    """
+    Return the timezone object for a timezone name, cached per name.
+
+    Args:
+        time_zone: Timezone name (e.g. 'Asia/Kolkata')
+
+    Returns:
+        tzinfo: Timezone object
+    """
+    return ZoneInfo(time_zone)
+
+
+@lru_cache(maxsize=1)
+def get_user_timezone():
+    """
+    Return the timezone used for formatting datetimes for users.
+
+    Resolved once from settings.TIME_ZONE (falling back to the system
+    timezone); the cache is cleared when TIME_ZONE changes at runtime
+    (see signals.py).
+
+    Returns:
+        tzinfo: Timezone object
+    """
+    time_zone = getattr(settings, 'TIME_ZONE', None) or f"{get_system_timezone()}"
+    return get_timezone(time_zone)
+
+
 def format_user_timezone(date_time):
     """
     Format datetime to user's timezone from settings.
@@ -137,16 +239,7 @@ def format_user_timezone(date_time):
     Returns:
         str: Formatted datetime string 'YYYY-MM-DD HH:MM:SS'
     """
-    time_zone = getattr(settings, 'TIME_ZONE', None)
-    if not time_zone:
-        try:
-            system_timezone = get_localzone()
-            time_zone = f"{system_timezone}"
-        except Exception as e:
-            print(f"Error fetching system timezone, defaulting to Asia/Kolkata: {e}")
-            time_zone = "Asia/Kolkata"
-
-    dtime = date_time.astimezone(pytz.timezone(time_zone))
+    dtime = date_time.astimezone(get_user_timezone())
     return dtime.strftime('%Y-%m-%d %H:%M:%S')
 
 
@@ -161,25 +254,26 @@ def format_date(datetime_str=None, tz_kolkata=None):
     Returns:
         datetime: Timezone-aware datetime object
     """
-    if not tz_kolkata:
-        try:
-            system_timezone = get_localzone()
-            tz_kolkata = system_timezone
-        except Exception as e:
-            print(f"Error fetching system timezone, defaulting to Asia/Kolkata: {e}")
-            tz_kolkata = ZoneInfo("Asia/Kolkata")
-
     if not datetime_str:
-        datetime_str = datetime.now(tz=tz_kolkata)
-    else:
-        if isinstance(datetime_str, str):
-            datetime_str = datetime.fromisoformat(datetime_str)
-        if datetime_str.tzinfo is None:
-            datetime_str = datetime_str.replace(tzinfo=tz_kolkata)
+        return datetime.now(tz=tz_kolkata or get_system_timezone())
+
+    if isinstance(datetime_str, str):
+        datetime_str = datetime.fromisoformat(datetime_str)
+
+    # Aware datetimes are returned as is, without resolving a timezone
+    if datetime_str.tzinfo is None:
+        datetime_str = datetime_str.replace(tzinfo=tz_kolkata or get_system_timezone())
 
     return datetime_str
 
 
+# (singular, plural) labels for years, months and days, per language
+DURATION_LABELS = {
+    'en': (("year", "years"), ("month", "months"), ("day", "days")),
+    'ar': (("سنة", "سنوات"), ("شهر", "شهور"), ("يوم", "أيام")),
+}
+
+
 def format_duration(duration, lang='en'):
     """
     Format timedelta into human-readable string.
@@ -192,32 +286,16 @@ def format_duration(duration, lang='en'):
         str: Formatted duration string (e.g., "2 years 3 months 5 days")
     """
     if duration:
-        total_days = duration.days
-        years = total_days // 365
-        months = (total_days % 365) // 30
-        days = (total_days % 365) % 30
+        years, remaining_days = divmod(duration.days, 365)
+        months, days = divmod(remaining_days, 30)
 
-        # Arabic equivalents for years, months, and days
-        year_word = "سنة" if years == 1 else "سنوات"
-        month_word = "شهر" if months == 1 else "شهور"
-        day_word = "يوم" if days == 1 else "أيام"
+        # (singular, plural) unit labels; unknown languages use English
+        labels = DURATION_LABELS.get(lang, DURATION_LABELS['en'])
 
         parts = []
-        if years > 0:
-            if lang == 'ar':
-                parts.append(f"{years} {year_word}")
-            else:
-                parts.append(f"{years} year{'s' if years > 1 else ''}")
-        if months > 0:
-            if lang == 'ar':
-                parts.append(f"{months} {month_word}")
-            else:
-                parts.append(f"{months} month{'s' if months > 1 else ''}")
-        if days > 0:
-            if lang == 'ar':
-                parts.append(f"{days} {day_word}")
-            else:
-                parts.append(f"{days} day{'s' if days > 1 else ''}")
+        for count, (singular, plural) in zip((years, months, days), labels):
+            if count > 0:
+                parts.append(f"{count} {singular if count == 1 else plural}")
 
         return " ".join(parts) if parts else "0 days"
     else:
@@ -6,11 +6,12 @@ Provides API endpoints for:
 2. Uploading and processing bulk form data from Excel files
 """
 
+import io
 import logging
-import tempfile
-import os
-from django.http import FileResponse
-from django.db import transaction
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, zip_longest
+from django.http import HttpResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -18,19 +19,33 @@ from rest_framework import status
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.utils import get_column_letter
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
 from openpyxl.formatting.rule import Rule
 from openpyxl.styles.differential import DifferentialStyle
 
 from ..models import FormType, FieldType, DataType, Form, FormSections, FormFields
 from ..services import bulk_upload_forms_services
-from django.db.models import Max, Q
+from ..signals import get_reference_data_version
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 import json
 
 logger = logging.getLogger(__name__)
 
+# JSON encoder for exported cells: orjson when the optional "fast" extra is
+# installed, otherwise the standard library. Both produce JSON the upload
+# parser reads back unchanged (orjson omits the optional whitespace).
+try:
+    import orjson
+
+    def dump_json(value):
+        return orjson.dumps(value).decode()
+except ImportError:
+    dump_json = json.dumps
+
 
 # ===============================
 # Swagger Documentation
@@ -90,6 +105,617 @@ error_example = {
 }
 
 
+# Content type of the generated .xlsx downloads
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Column letters for the first 100 columns (index 0 is "A"), computed once
+COLUMN_LETTERS = tuple(get_column_letter(i) for i in range(1, 101))
+
+# Rows fetched per database round trip while exporting
+EXPORT_CHUNK_SIZE = 2000
+
+# Rows fetched per database round trip while loading reference data
+REFERENCE_CHUNK_SIZE = 500
+
+# Fixed dropdown lists written to the hidden References sheet
+BOOLEAN_OPTIONS = ("TRUE", "FALSE")
+WIDTH_OPTIONS = ("25% (1/4)", "33% (1/3)", "50% (1/2)", "66% (2/3)", "75% (3/4)", "100% (Full)")
+
+# Width dropdown label per stored width value (e.g. "50" -> "50% (1/2)")
+WIDTH_DISPLAY_MAP = {option.split("%", 1)[0]: option for option in WIDTH_OPTIONS}
+
+# Workbook styles shared by the template and export sheets
+TITLE_FONT = Font(size=14, bold=True, color="FFFFFF")
+TITLE_FILL = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+NOTE_FONT = Font(size=10, italic=True, color="FF0000")
+HEADER_FONT = Font(bold=True, color="000000")
+HEADER_FILL = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
+BOLD_FONT = Font(bold=True)
+CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+WRAP_CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+# Named style for sheet header rows, registered once per workbook
+HEADER_STYLE_NAME = "header_row"
+
+# Highlight for duplicate Form Titles
+DUPLICATE_HIGHLIGHT = DifferentialStyle(
+    fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
+    font=Font(color="9C0006", bold=True)
+)
+
+# Description of the validation keys per data type for the Validation Rules sheet
+DATA_TYPE_RULE_DESCRIPTIONS = {
+    "text": "minLength: min chars, maxLength: max chars, pattern: regex",
+    "textarea": "minLength: min chars, maxLength: max chars, pattern: regex",
+    "number": "min: min value, max: max value, isInteger: true/false, isPositive: true/false",
+    "date": "minDate: YYYY-MM-DD, maxDate: YYYY-MM-DD",
+    "date_range": "startDateBeforeOrEqualEndDate: true/false",
+    "time": "minTime: HH:MM, maxTime: HH:MM",
+    "time_range": "startTimeBeforeOrEqualEndTime: true/false",
+    "select": "minSelection: min items, maxSelection: max items, isMultiple: true/false",
+    "checkbox": "minSelection: min items, maxSelection: max items, isMultiple: true/false",
+    "file": "fileType: extensions, maxFileSize: MB, isMultiple: true/false",
+    "image": "maxFileSize: MB, resolution: WxH, aspectRatio: W:H, isMultiple: true/false",
+    "password": "minLength: min chars, maxLength: max chars, containsSpecialChar: true/false, strengthCheck: true/false",
+    "range": "min: min value, max: max value, step: increment",
+    "signature": "maxSize: KB, maxDimensions: WxH",
+    "richtext": "minContentLength: min chars, maxContentLength: max chars, disallowedTags: array",
+}
+
+# Example validation JSON per data type for the Validation Rules sheet
+DATA_TYPE_RULE_EXAMPLES = {
+    "text": '{"minLength": 5, "maxLength": 100}',
+    "textarea": '{"minLength": 10, "maxLength": 500}',
+    "number": '{"min": 0, "max": 100, "isInteger": true}',
+    "date": '{"minDate": "2024-01-01", "maxDate": "2025-12-31"}',
+    "date_range": '{"startDateBeforeOrEqualEndDate": true}',
+    "time": '{"minTime": "09:00", "maxTime": "18:00"}',
+    "time_range": '{"startTimeBeforeOrEqualEndTime": true}',
+    "select": '{"isMultiple": true, "minSelection": 1, "maxSelection": 3}',
+    "checkbox": '{"isMultiple": true, "maxSelection": 5}',
+    "file": '{"fileType": ".pdf,.doc", "maxFileSize": 10, "isMultiple": false}',
+    "image": '{"maxFileSize": 5, "isMultiple": true}',
+    "password": '{"minLength": 8, "containsSpecialChar": true}',
+    "range": '{"min": 0, "max": 100, "step": 5}',
+    "signature": '{"maxSize": 500}',
+    "richtext": '{"maxContentLength": 5000}',
+}
+
+
+# ===============================
+# Reference Data
+# ===============================
+
+@lru_cache(maxsize=1)
+def get_template_dropdown_data(version):
+    """
+    Fetch the dropdown lists used by the bulk upload template and export.
+
+    Cached per reference data version. The version is replaced once a
+    FormType, FieldType or DataType change commits, and expires after
+    REFERENCE_DATA_VERSION_TIMEOUT seconds, so the lists are at most that
+    old when a change sends no signal or another worker made it.
+
+    Args:
+        version: Reference data version from get_reference_data_version()
+
+    Returns:
+        tuple: (form_types, field_types, data_types, data_type_rules) where
+            the first three are tuples of names and data_type_rules is a
+            tuple of (data type name, validation rule keys)
+    """
+    # FormType uses effective_end_date for soft delete
+    form_types = tuple(
+        FormType.objects.filter(effective_end_date__isnull=True)
+        .values_list("name", flat=True)
+        .order_by("name")
+        .iterator(chunk_size=REFERENCE_CHUNK_SIZE)
+    )
+
+    # FieldType uses is_deleted for soft delete
+    field_types = tuple(
+        FieldType.objects.filter(is_deleted=False)
+        .values_list("name", flat=True)
+        .order_by("name")
+        .iterator(chunk_size=REFERENCE_CHUNK_SIZE)
+    )
+
+    # DataType uses is_deleted for soft delete; names and validation rules
+    # come from the same query
+    data_type_rules = tuple(
+        (name, tuple(rules or ()))
+        for name, rules in DataType.objects.filter(is_deleted=False)
+        .values_list("name", "validation_rules")
+        .order_by("name")
+        .iterator(chunk_size=REFERENCE_CHUNK_SIZE)
+    )
+    data_types = tuple(name for name, _ in data_type_rules)
+
+    return form_types, field_types, data_types, data_type_rules
+
+
+# ===============================
+# Workbook Helpers
+# ===============================
+
+def styled_cell(ws, value, font=None, fill=None, alignment=None, style=None):
+    """
+    Build a styled cell for a write-only worksheet.
+
+    Args:
+        ws: Write-only worksheet the cell will be appended to
+        value: Cell value
+        font: Optional Font
+        fill: Optional PatternFill
+        alignment: Optional Alignment
+        style: Optional name of a NamedStyle registered on the workbook
+
+    Returns:
+        WriteOnlyCell: Cell ready to be passed to ws.append()
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    if style:
+        cell.style = style
+    if font:
+        cell.font = font
+    if fill:
+        cell.fill = fill
+    if alignment:
+        cell.alignment = alignment
+    return cell
+
+
+def append_sheet_heading(ws, title, note, headers):
+    """
+    Append the title row, note row and header row (rows 1-3) to a
+    write-only template sheet.
+
+    The title and note rows are merged across all header columns.
+
+    Args:
+        ws: Write-only worksheet with no rows yet
+        title: Sheet title (row 1)
+        note: Instruction note (row 2)
+        headers: Column headers (row 3)
+    """
+    last_col = COLUMN_LETTERS[len(headers) - 1]
+
+    # Title row
+    ws.append([styled_cell(
+        ws, title,
+        font=TITLE_FONT,
+        fill=TITLE_FILL,
+        alignment=CENTER_ALIGNMENT,
+    )])
+    ws.merged_cells.add(f"A1:{last_col}1")
+
+    # Note row
+    ws.append([styled_cell(
+        ws, note,
+        font=NOTE_FONT,
+        alignment=WRAP_CENTER_ALIGNMENT,
+    )])
+    ws.merged_cells.add(f"A2:{last_col}2")
+
+    # Header row (row 3)
+    wb = ws.parent
+    if HEADER_STYLE_NAME not in wb.named_styles:
+        wb.add_named_style(NamedStyle(
+            name=HEADER_STYLE_NAME,
+            font=HEADER_FONT,
+            fill=HEADER_FILL,
+            alignment=CENTER_ALIGNMENT,
+        ))
+    ws.append([styled_cell(ws, header, style=HEADER_STYLE_NAME) for header in headers])
+
+
+def json_cell(value):
+    """
+    Encode a JSON column value for an export cell.
+
+    Args:
+        value: Decoded JSON value (dict, list, ...)
+
+    Returns:
+        str: JSON text, or "" for empty values
+    """
+    return dump_json(value) if value else ""
+
+
+def xlsx_response(content, filename):
+    """
+    Build the download response for a saved workbook.
+
+    An .xlsx file is already a deflate-compressed ZIP archive, so the body
+    is sent as-is with its exact length; compressing it again in transit
+    saves next to nothing.
+
+    Args:
+        content: Workbook bytes
+        filename: Download file name
+
+    Returns:
+        HttpResponse: Attachment response
+    """
+    response = HttpResponse(content, content_type=XLSX_CONTENT_TYPE)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["Content-Length"] = len(content)
+    return response
+
+
+def build_export_field_row(field, field_order):
+    """
+    Build a Fields sheet row for the export.
+
+    Args:
+        field: Row dict from the export fields query (form title, section
+            name, type names and parent label included)
+        field_order: Sequential order of the field within its section
+
+    Returns:
+        list: Row values in fields sheet column order
+    """
+    additional_info = field["additional_info"] or {}
+
+    # Extract width and options from additional_info
+    width = additional_info.get("width", "100")
+    options = additional_info.get("options", [])
+
+    # Additional Info (excluding width and options)
+    filtered_info = {k: v for k, v in additional_info.items() if k not in ["width", "options"]}
+
+    return [
+        field["section__form__title"],
+        field["section__name"],
+        field["label"],
+        field["field_type__name"] or "",
+        field["field_type__data_type__name"] or "",
+        "TRUE" if field["required"] else "FALSE",
+        field_order,
+        WIDTH_DISPLAY_MAP.get(str(width), f"{width}%"),
+        json_cell(options),
+        field["parent_label"] or "",
+        json_cell(field["dependency"]),
+        json_cell(filtered_info),
+    ]
+
+
+# ===============================
+# Template Workbook
+# ===============================
+
+@lru_cache(maxsize=1)
+def build_forms_template(version):
+    """
+    Build the bulk upload template workbook.
+
+    Template includes:
+    - Sheet 1: Forms (form metadata)
+    - Sheet 2: Sections (section definitions)
+    - Sheet 3: Fields (field definitions)
+    - Sheet 4: Validation Rules (validation keys per data type)
+    - Sheet 5: References (hidden sheet with dropdown data)
+
+    The template only depends on the reference data, so the saved bytes are
+    cached per reference data version. The version changes when a reference
+    data change commits and at least every REFERENCE_DATA_VERSION_TIMEOUT
+    seconds, so every worker rebuilds within that bound.
+
+    Args:
+        version: Reference data version from get_reference_data_version()
+
+    Returns:
+        bytes: Saved .xlsx workbook
+    """
+    # Dropdown data (only active records)
+    form_types, field_types, data_types, data_type_rules = get_template_dropdown_data(version)
+
+    # Create write-only workbook (column widths must be set before the
+    # first row of a sheet is appended)
+    wb = Workbook(write_only=True)
+
+    # Define common variables for data validation
+    num_rows = 100  # Number of rows available for user input
+    start_row = 4   # First editable row (after title, note, and header rows)
+
+    # =============================
+    # SHEET 1: FORMS
+    # =============================
+    ws_forms = wb.create_sheet("Forms")
+
+    # Set column widths
+    ws_forms.column_dimensions["A"].width = 30
+    ws_forms.column_dimensions["B"].width = 25
+    ws_forms.column_dimensions["C"].width = 40
+    ws_forms.column_dimensions["D"].width = 15
+
+    # Title, note and header rows
+    forms_headers = ["Form Title", "Form Type", "Description", "Is Completed"]
+    append_sheet_heading(
+        ws_forms,
+        "Bulk Upload Forms - Form Metadata",
+        "NOTE: Do not modify header names. Select Form Type from dropdown. "
+        "Form Title must be unique.",
+        forms_headers,
+    )
+
+    # Add conditional formatting to highlight duplicate Form Titles
+    rule = Rule(type="duplicateValues", dxf=DUPLICATE_HIGHLIGHT, stopIfTrue=False)
+    ws_forms.conditional_formatting.add("A4:A103", rule)
+
+    # =============================
+    # SHEET 2: SECTIONS
+    # =============================
+    ws_sections = wb.create_sheet("Sections")
+
+    # Set column widths
+    ws_sections.column_dimensions["A"].width = 30
+    ws_sections.column_dimensions["B"].width = 30
+    ws_sections.column_dimensions["C"].width = 40
+    ws_sections.column_dimensions["D"].width = 15
+    ws_sections.column_dimensions["E"].width = 25  # Dependency Section
+    ws_sections.column_dimensions["F"].width = 25  # Dependency Field
+    ws_sections.column_dimensions["G"].width = 25  # Dependency Option
+    ws_sections.column_dimensions["H"].width = 30  # Dependency (JSON)
+
+    # Title, note and header rows
+    sections_headers = [
+        "Form Title", "Section Name", "Section Description", "Section Order",
+        "Dependency Section", "Dependency Field", "Dependency Option", "Dependency (JSON)"
+    ]
+    append_sheet_heading(
+        ws_sections,
+        "Bulk Upload Forms - Sections",
+        "NOTE: Select Form Title from dropdown. Section Order must be unique within each form. "
+        "For simple dependencies, use the three dependency columns (Section, Field, Option) instead of the JSON Dependency column.",
+        sections_headers,
+    )
+
+    # Add dynamic dropdown for Form Title (uses OFFSET formula for dynamic range)
+    # This formula counts non-empty cells in Forms!A4:A103 and creates a dynamic list
+    form_title_sections_dv = DataValidation(
+        type="list",
+        formula1="=OFFSET(Forms!$A$4,0,0,COUNTA(Forms!$A$4:$A$103),1)",
+        allow_blank=False,
+        showErrorMessage=True,
+        errorTitle="Invalid Form Title",
+        error="Please select a Form Title from the Forms sheet"
+    )
+    ws_sections.data_validations.append(form_title_sections_dv)
+    form_title_col_sections = sections_headers.index("Form Title") + 1
+    form_title_sections_dv.add(
+        f"{COLUMN_LETTERS[form_title_col_sections - 1]}{start_row}:"
+        f"{COLUMN_LETTERS[form_title_col_sections - 1]}{start_row + num_rows}"
+    )
+
+    # =============================
+    # SHEET 3: FIELDS
+    # =============================
+    ws_fields = wb.create_sheet("Fields")
+
+    # Set column widths
+    column_widths = {
+        "A": 30, "B": 25, "C": 25,
+        "D": 20, "E": 20, "F": 12, "G": 12,
+        "H": 15, "I": 30, "J": 40, "K": 25,
+        "L": 20, "M": 20, "N": 20,
+        "O": 35, "P": 30
+    }
+    for col_letter, width in column_widths.items():
+        ws_fields.column_dimensions[col_letter].width = width
+
+    # Title, note and header rows
+    fields_headers = [
+        "Form Title", "Section Name", "Field Label",
+        "Field Type", "Data Type", "Required", "Field Order",
+        "Width", "Options", "Validation", "Parent Field",
+        "Field Dep Section", "Field Dep Field", "Field Dep Option",
+        "Dependency", "Additional Info"
+    ]
+    append_sheet_heading(
+        ws_fields,
+        "Bulk Upload Forms - Fields",
+        "NOTE: Select Form Title, Section Name, Field Type, Data Type, and Width from dropdowns. "
+        "Options format: [\"Option1\",\"Option2\"]. "
+        "For field dependency, use the three columns (Field Dep Section/Field/Option) or JSON Dependency column.",
+        fields_headers,
+    )
+
+    # Add dynamic dropdown for Form Title (uses OFFSET formula for dynamic range)
+    # This formula counts non-empty cells in Forms!A4:A103 and creates a dynamic list
+    form_title_fields_dv = DataValidation(
+        type="list",
+        formula1="=OFFSET(Forms!$A$4,0,0,COUNTA(Forms!$A$4:$A$103),1)",
+        allow_blank=False,
+        showErrorMessage=True,
+        errorTitle="Invalid Form Title",
+        error="Please select a Form Title from the Forms sheet"
+    )
+    ws_fields.data_validations.append(form_title_fields_dv)
+    form_title_col_fields = fields_headers.index("Form Title") + 1
+    form_title_fields_dv.add(
+        f"{COLUMN_LETTERS[form_title_col_fields - 1]}{start_row}:"
+        f"{COLUMN_LETTERS[form_title_col_fields - 1]}{start_row + num_rows}"
+    )
+
+    # Add dynamic dropdown for Section Name (uses OFFSET formula for dynamic range)
+    # This formula counts non-empty cells in Sections!B4:B103 and creates a dynamic list
+    section_name_fields_dv = DataValidation(
+        type="list",
+        formula1="=OFFSET(Sections!$B$4,0,0,COUNTA(Sections!$B$4:$B$103),1)",
+        allow_blank=False,
+        showErrorMessage=True,
+        errorTitle="Invalid Section Name",
+        error="Please select a Section Name from the Sections sheet"
+    )
+    ws_fields.data_validations.append(section_name_fields_dv)
+    section_name_col_fields = fields_headers.index("Section Name") + 1
+    section_name_fields_dv.add(
+        f"{COLUMN_LETTERS[section_name_col_fields - 1]}{start_row}:"
+        f"{COLUMN_LETTERS[section_name_col_fields - 1]}{start_row + num_rows}"
+    )
+
+    # =============================
+    # SHEET 4: VALIDATION RULES (Visible - Reference for users)
+    # =============================
+    ws_validation = wb.create_sheet("Validation Rules")
+
+    # Set column widths
+    ws_validation.column_dimensions["A"].width = 15
+    ws_validation.column_dimensions["B"].width = 50
+    ws_validation.column_dimensions["C"].width = 60
+    ws_validation.column_dimensions["D"].width = 50
+
+    # Title, note and header rows
+    validation_headers = ["Data Type", "Validation Keys", "Description", "Example"]
+    append_sheet_heading(
+        ws_validation,
+        "Validation Rules by Data Type",
+        "Use the validation keys below in JSON format in the Validation column. "
+        "Example: {\"minLength\": 5, \"maxLength\": 100}",
+        validation_headers,
+    )
+
+    # Populate validation rules data (fetched with the dropdown data)
+    for data_type_name, rules in data_type_rules:
+        ws_validation.append([
+            data_type_name,
+            ", ".join(rules) if rules else "None",
+            DATA_TYPE_RULE_DESCRIPTIONS.get(data_type_name, ""),
+            DATA_TYPE_RULE_EXAMPLES.get(data_type_name, ""),
+        ])
+
+    # =============================
+    # SHEET 5: REFERENCES (Hidden)
+    # =============================
+    ws_ref = wb.create_sheet("References")
+
+    # Hide the reference sheet
+    ws_ref.sheet_state = "hidden"
+
+    # Column headers (bold)
+    ref_headers = ["Form Types", "Field Types", "Data Types", "Boolean", "Width"]
+    ws_ref.append([styled_cell(ws_ref, header, font=BOLD_FONT) for header in ref_headers])
+
+    # One column per list: form types, field types, data types, boolean
+    # values and width options, written row by row
+    for row in zip_longest(form_types, field_types, data_types, BOOLEAN_OPTIONS, WIDTH_OPTIONS):
+        ws_ref.append(row)
+
+    # =============================
+    # DATA VALIDATION (Dropdowns)
+    # =============================
+    # Forms sheet - Form Type dropdown
+    if form_types:
+        max_ref_row = len(form_types) + 1
+        form_type_dv = DataValidation(
+            type="list",
+            formula1=f"=References!$A$2:$A${max_ref_row}",
+            allow_blank=False
+        )
+        ws_forms.data_validations.append(form_type_dv)
+        form_type_col = forms_headers.index("Form Type") + 1
+        form_type_dv.add(
+            f"{COLUMN_LETTERS[form_type_col - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[form_type_col - 1]}{start_row + num_rows}"
+        )
+
+    # Forms sheet - Is Completed dropdown
+    is_completed_dv = DataValidation(
+        type="list",
+        formula1="=References!$D$2:$D$3",
+        allow_blank=True
+    )
+    ws_forms.data_validations.append(is_completed_dv)
+    is_completed_col = forms_headers.index("Is Completed") + 1
+    is_completed_dv.add(
+        f"{COLUMN_LETTERS[is_completed_col - 1]}{start_row}:"
+        f"{COLUMN_LETTERS[is_completed_col - 1]}{start_row + num_rows}"
+    )
+
+    # Fields sheet - Field Type dropdown
+    if field_types:
+        max_ref_row = len(field_types) + 1
+        field_type_dv = DataValidation(
+            type="list",
+            formula1=f"=References!$B$2:$B${max_ref_row}",
+            allow_blank=False
+        )
+        ws_fields.data_validations.append(field_type_dv)
+        field_type_col = fields_headers.index("Field Type") + 1
+        field_type_dv.add(
+            f"{COLUMN_LETTERS[field_type_col - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[field_type_col - 1]}{start_row + num_rows}"
+        )
+
+    # Fields sheet - Data Type dropdown
+    if data_types:
+        max_ref_row = len(data_types) + 1
+        data_type_dv = DataValidation(
+            type="list",
+            formula1=f"=References!$C$2:$C${max_ref_row}",
+            allow_blank=False
+        )
+        ws_fields.data_validations.append(data_type_dv)
+        data_type_col = fields_headers.index("Data Type") + 1
+        data_type_dv.add(
+            f"{COLUMN_LETTERS[data_type_col - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[data_type_col - 1]}{start_row + num_rows}"
+        )
+
+    # Fields sheet - Required dropdown
+    required_dv = DataValidation(
+        type="list",
+        formula1="=References!$D$2:$D$3",
+        allow_blank=True
+    )
+    ws_fields.data_validations.append(required_dv)
+    required_col = fields_headers.index("Required") + 1
+    required_dv.add(
+        f"{COLUMN_LETTERS[required_col - 1]}{start_row}:"
+        f"{COLUMN_LETTERS[required_col - 1]}{start_row + num_rows}"
+    )
+
+    # Fields sheet - Width dropdown
+    width_dv = DataValidation(
+        type="list",
+        formula1="=References!$E$2:$E$7",
+        allow_blank=True
+    )
+    ws_fields.data_validations.append(width_dv)
+    width_col = fields_headers.index("Width") + 1
+    width_dv.add(
+        f"{COLUMN_LETTERS[width_col - 1]}{start_row}:"
+        f"{COLUMN_LETTERS[width_col - 1]}{start_row + num_rows}"
+    )
+
+    # =============================
+    # ADD SAMPLE DATA (Optional)
+    # =============================
+    # You can uncomment this section to add sample rows
+
+    # Sample form
+    # ws_forms.append(["Safety Inspection Checklist", form_types[0] if form_types else "",
+    #                  "Monthly safety inspection form", "TRUE"])
+
+    # Sample section
+    # ws_sections.append(["Safety Inspection Checklist", "General Information",
+    #                     "Basic inspection details", 1])
+
+    # Sample field
+    # ws_fields.append(["Safety Inspection Checklist", "General Information", "Inspector Name",
+    #                   field_types[0] if field_types else "", data_types[0] if data_types else "",
+    #                   "TRUE", 1])
+
+    # =============================
+    # SAVE
+    # =============================
+    buffer = io.BytesIO()
+    wb.save(buffer)
+
+    return buffer.getvalue()
+
+
 # ===============================
 # API Endpoints
 # ===============================
@@ -119,7 +745,6 @@ error_example = {
 )
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
-@transaction.atomic
 def bulk_upload_forms(request):
     """
     Upload and process bulk form data from Excel file.
@@ -180,511 +805,16 @@ def download_forms_template(request):
     - Instruction row (merged, styled)
     - Header row (colored, bold)
     - Data validation dropdowns
+
+    The workbook is built in write-only mode (see build_forms_template) and
+    cached per reference data version.
     """
     try:
-        # Fetch dropdown data from database (only active records)
-        # FormType uses effective_end_date for soft delete
-        form_types = list(
-            FormType.objects.filter(effective_end_date__isnull=True)
-            .values_list("name", flat=True)
-            .order_by("name")
-        )
-
-        # FieldType uses is_deleted for soft delete
-        field_types = list(
-            FieldType.objects.filter(is_deleted=False)
-            .values_list("name", flat=True)
-            .order_by("name")
-        )
-
-        # DataType uses is_deleted for soft delete
-        data_types = list(
-            DataType.objects.filter(is_deleted=False)
-            .values_list("name", flat=True)
-            .order_by("name")
-        )
-
-        # Create workbook
-        wb = Workbook()
-
-        # Define common variables for data validation
-        num_rows = 100  # Number of rows available for user input
-        start_row = 4   # First editable row (after title, note, and header rows)
-
-        # =============================
-        # SHEET 1: FORMS
-        # =============================
-        ws_forms = wb.active
-        ws_forms.title = "Forms"
-
-        # Title row
-        ws_forms.merge_cells("A1:D1")
-        title_cell = ws_forms["A1"]
-        title_cell.value = "Bulk Upload Forms - Form Metadata"
-        title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Note row
-        ws_forms.merge_cells("A2:D2")
-        note_cell = ws_forms["A2"]
-        note_cell.value = (
-            "NOTE: Do not modify header names. Select Form Type from dropdown. "
-            "Form Title must be unique."
-        )
-        note_cell.font = Font(size=10, italic=True, color="FF0000")
-        note_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Header row (row 3)
-        forms_headers = ["Form Title", "Form Type", "Description", "Is Completed"]
-        header_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        header_font = Font(bold=True, color="000000")
-
-        for col_num, header in enumerate(forms_headers, 1):
-            cell = ws_forms.cell(row=3, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Set column widths
-        ws_forms.column_dimensions["A"].width = 30
-        ws_forms.column_dimensions["B"].width = 25
-        ws_forms.column_dimensions["C"].width = 40
-        ws_forms.column_dimensions["D"].width = 15
-
-        # Add conditional formatting to highlight duplicate Form Titles
-        dxf = DifferentialStyle(
-            fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
-            font=Font(color="9C0006", bold=True)
-        )
-        rule = Rule(type="duplicateValues", dxf=dxf, stopIfTrue=False)
-        ws_forms.conditional_formatting.add("A4:A103", rule)
-
-        # =============================
-        # SHEET 2: SECTIONS
-        # =============================
-        ws_sections = wb.create_sheet("Sections")
-
-        # Title row
-        ws_sections.merge_cells("A1:H1")
-        title_cell = ws_sections["A1"]
-        title_cell.value = "Bulk Upload Forms - Sections"
-        title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Note row
-        ws_sections.merge_cells("A2:H2")
-        note_cell = ws_sections["A2"]
-        note_cell.value = (
-            "NOTE: Select Form Title from dropdown. Section Order must be unique within each form. "
-            "For simple dependencies, use the three dependency columns (Section, Field, Option) instead of the JSON Dependency column."
-        )
-        note_cell.font = Font(size=10, italic=True, color="FF0000")
-        note_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Header row
-        sections_headers = [
-            "Form Title", "Section Name", "Section Description", "Section Order",
-            "Dependency Section", "Dependency Field", "Dependency Option", "Dependency (JSON)"
-        ]
-
-        for col_num, header in enumerate(sections_headers, 1):
-            cell = ws_sections.cell(row=3, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Set column widths
-        ws_sections.column_dimensions["A"].width = 30
-        ws_sections.column_dimensions["B"].width = 30
-        ws_sections.column_dimensions["C"].width = 40
-        ws_sections.column_dimensions["D"].width = 15
-        ws_sections.column_dimensions["E"].width = 25  # Dependency Section
-        ws_sections.column_dimensions["F"].width = 25  # Dependency Field
-        ws_sections.column_dimensions["G"].width = 25  # Dependency Option
-        ws_sections.column_dimensions["H"].width = 30  # Dependency (JSON)
-
-        # Add dynamic dropdown for Form Title (uses OFFSET formula for dynamic range)
-        # This formula counts non-empty cells in Forms!A4:A103 and creates a dynamic list
-        form_title_sections_dv = DataValidation(
-            type="list",
-            formula1="=OFFSET(Forms!$A$4,0,0,COUNTA(Forms!$A$4:$A$103),1)",
-            allow_blank=False,
-            showErrorMessage=True,
-            errorTitle="Invalid Form Title",
-            error="Please select a Form Title from the Forms sheet"
-        )
-        ws_sections.add_data_validation(form_title_sections_dv)
-        form_title_col_sections = sections_headers.index("Form Title") + 1
-        form_title_sections_dv.add(
-            f"{get_column_letter(form_title_col_sections)}{start_row}:"
-            f"{get_column_letter(form_title_col_sections)}{start_row + num_rows}"
-        )
-
-        # =============================
-        # SHEET 3: FIELDS
-        # =============================
-        ws_fields = wb.create_sheet("Fields")
-
-        # Title row
-        ws_fields.merge_cells("A1:P1")
-        title_cell = ws_fields["A1"]
-        title_cell.value = "Bulk Upload Forms - Fields"
-        title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Note row
-        ws_fields.merge_cells("A2:P2")
-        note_cell = ws_fields["A2"]
-        note_cell.value = (
-            "NOTE: Select Form Title, Section Name, Field Type, Data Type, and Width from dropdowns. "
-            "Options format: [\"Option1\",\"Option2\"]. "
-            "For field dependency, use the three columns (Field Dep Section/Field/Option) or JSON Dependency column."
-        )
-        note_cell.font = Font(size=10, italic=True, color="FF0000")
-        note_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Header row
-        fields_headers = [
-            "Form Title", "Section Name", "Field Label",
-            "Field Type", "Data Type", "Required", "Field Order",
-            "Width", "Options", "Validation", "Parent Field",
-            "Field Dep Section", "Field Dep Field", "Field Dep Option",
-            "Dependency", "Additional Info"
-        ]
-
-        for col_num, header in enumerate(fields_headers, 1):
-            cell = ws_fields.cell(row=3, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Set column widths
-        column_widths = {
-            "A": 30, "B": 25, "C": 25,
-            "D": 20, "E": 20, "F": 12, "G": 12,
-            "H": 15, "I": 30, "J": 40, "K": 25,
-            "L": 20, "M": 20, "N": 20,
-            "O": 35, "P": 30
-        }
-        for col_letter, width in column_widths.items():
-            ws_fields.column_dimensions[col_letter].width = width
-
-        # Add dynamic dropdown for Form Title (uses OFFSET formula for dynamic range)
-        # This formula counts non-empty cells in Forms!A4:A103 and creates a dynamic list
-        form_title_fields_dv = DataValidation(
-            type="list",
-            formula1="=OFFSET(Forms!$A$4,0,0,COUNTA(Forms!$A$4:$A$103),1)",
-            allow_blank=False,
-            showErrorMessage=True,
-            errorTitle="Invalid Form Title",
-            error="Please select a Form Title from the Forms sheet"
-        )
-        ws_fields.add_data_validation(form_title_fields_dv)
-        form_title_col_fields = fields_headers.index("Form Title") + 1
-        form_title_fields_dv.add(
-            f"{get_column_letter(form_title_col_fields)}{start_row}:"
-            f"{get_column_letter(form_title_col_fields)}{start_row + num_rows}"
-        )
-
-        # Add dynamic dropdown for Section Name (uses OFFSET formula for dynamic range)
-        # This formula counts non-empty cells in Sections!B4:B103 and creates a dynamic list
-        section_name_fields_dv = DataValidation(
-            type="list",
-            formula1="=OFFSET(Sections!$B$4,0,0,COUNTA(Sections!$B$4:$B$103),1)",
-            allow_blank=False,
-            showErrorMessage=True,
-            errorTitle="Invalid Section Name",
-            error="Please select a Section Name from the Sections sheet"
-        )
-        ws_fields.add_data_validation(section_name_fields_dv)
-        section_name_col_fields = fields_headers.index("Section Name") + 1
-        section_name_fields_dv.add(
-            f"{get_column_letter(section_name_col_fields)}{start_row}:"
-            f"{get_column_letter(section_name_col_fields)}{start_row + num_rows}"
-        )
-
-        # =============================
-        # SHEET 4: VALIDATION RULES (Visible - Reference for users)
-        # =============================
-        ws_validation = wb.create_sheet("Validation Rules")
-
-        # Title row
-        ws_validation.merge_cells("A1:D1")
-        title_cell = ws_validation["A1"]
-        title_cell.value = "Validation Rules by Data Type"
-        title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Note row
-        ws_validation.merge_cells("A2:D2")
-        note_cell = ws_validation["A2"]
-        note_cell.value = (
-            "Use the validation keys below in JSON format in the Validation column. "
-            "Example: {\"minLength\": 5, \"maxLength\": 100}"
-        )
-        note_cell.font = Font(size=10, italic=True, color="FF0000")
-        note_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Header row
-        validation_headers = ["Data Type", "Validation Keys", "Description", "Example"]
-        for col_num, header in enumerate(validation_headers, 1):
-            cell = ws_validation.cell(row=3, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Fetch validation rules from DataType model
-        data_type_rules = DataType.objects.filter(is_deleted=False).values('name', 'validation_rules')
-
-        # Populate validation rules data
-        row_num = 4
-        for dt in data_type_rules:
-            data_type_name = dt['name']
-            rules = dt['validation_rules'] or []
-
-            ws_validation[f"A{row_num}"] = data_type_name
-            ws_validation[f"B{row_num}"] = ", ".join(rules) if rules else "None"
-
-            # Add descriptions and examples based on data type
-            descriptions = {
-                "text": "minLength: min chars, maxLength: max chars, pattern: regex",
-                "textarea": "minLength: min chars, maxLength: max chars, pattern: regex",
-                "number": "min: min value, max: max value, isInteger: true/false, isPositive: true/false",
-                "date": "minDate: YYYY-MM-DD, maxDate: YYYY-MM-DD",
-                "date_range": "startDateBeforeOrEqualEndDate: true/false",
-                "time": "minTime: HH:MM, maxTime: HH:MM",
-                "time_range": "startTimeBeforeOrEqualEndTime: true/false",
-                "select": "minSelection: min items, maxSelection: max items, isMultiple: true/false",
-                "checkbox": "minSelection: min items, maxSelection: max items, isMultiple: true/false",
-                "file": "fileType: extensions, maxFileSize: MB, isMultiple: true/false",
-                "image": "maxFileSize: MB, resolution: WxH, aspectRatio: W:H, isMultiple: true/false",
-                "password": "minLength: min chars, maxLength: max chars, containsSpecialChar: true/false, strengthCheck: true/false",
-                "range": "min: min value, max: max value, step: increment",
-                "signature": "maxSize: KB, maxDimensions: WxH",
-                "richtext": "minContentLength: min chars, maxContentLength: max chars, disallowedTags: array",
-            }
-
-            examples = {
-                "text": '{"minLength": 5, "maxLength": 100}',
-                "textarea": '{"minLength": 10, "maxLength": 500}',
-                "number": '{"min": 0, "max": 100, "isInteger": true}',
-                "date": '{"minDate": "2024-01-01", "maxDate": "2025-12-31"}',
-                "date_range": '{"startDateBeforeOrEqualEndDate": true}',
-                "time": '{"minTime": "09:00", "maxTime": "18:00"}',
-                "time_range": '{"startTimeBeforeOrEqualEndTime": true}',
-                "select": '{"isMultiple": true, "minSelection": 1, "maxSelection": 3}',
-                "checkbox": '{"isMultiple": true, "maxSelection": 5}',
-                "file": '{"fileType": ".pdf,.doc", "maxFileSize": 10, "isMultiple": false}',
-                "image": '{"maxFileSize": 5, "isMultiple": true}',
-                "password": '{"minLength": 8, "containsSpecialChar": true}',
-                "range": '{"min": 0, "max": 100, "step": 5}',
-                "signature": '{"maxSize": 500}',
-                "richtext": '{"maxContentLength": 5000}',
-            }
-
-            ws_validation[f"C{row_num}"] = descriptions.get(data_type_name, "")
-            ws_validation[f"D{row_num}"] = examples.get(data_type_name, "")
-            row_num += 1
-
-        # Set column widths
-        ws_validation.column_dimensions["A"].width = 15
-        ws_validation.column_dimensions["B"].width = 50
-        ws_validation.column_dimensions["C"].width = 60
-        ws_validation.column_dimensions["D"].width = 50
-
-        # =============================
-        # SHEET 5: REFERENCES (Hidden)
-        # =============================
-        ws_ref = wb.create_sheet("References")
-
-        # Form Types
-        ws_ref["A1"] = "Form Types"
-        ws_ref["A1"].font = Font(bold=True)
-        for i, name in enumerate(form_types, start=2):
-            ws_ref[f"A{i}"] = name
-
-        # Field Types
-        ws_ref["B1"] = "Field Types"
-        ws_ref["B1"].font = Font(bold=True)
-        for i, name in enumerate(field_types, start=2):
-            ws_ref[f"B{i}"] = name
-
-        # Data Types
-        ws_ref["C1"] = "Data Types"
-        ws_ref["C1"].font = Font(bold=True)
-        for i, name in enumerate(data_types, start=2):
-            ws_ref[f"C{i}"] = name
-
-        # Boolean values
-        ws_ref["D1"] = "Boolean"
-        ws_ref["D1"].font = Font(bold=True)
-        ws_ref["D2"] = "TRUE"
-        ws_ref["D3"] = "FALSE"
-
-        # Width options
-        ws_ref["E1"] = "Width"
-        ws_ref["E1"].font = Font(bold=True)
-        width_options = [
-            "25% (1/4)",
-            "33% (1/3)",
-            "50% (1/2)",
-            "66% (2/3)",
-            "75% (3/4)",
-            "100% (Full)"
-        ]
-        for i, width_value in enumerate(width_options, start=2):
-            ws_ref[f"E{i}"] = width_value
-
-        # Hide the reference sheet
-        ws_ref.sheet_state = "hidden"
-
-        # =============================
-        # DATA VALIDATION (Dropdowns)
-        # =============================
-        # Forms sheet - Form Type dropdown
-        if form_types:
-            max_ref_row = len(form_types) + 1
-            form_type_dv = DataValidation(
-                type="list",
-                formula1=f"=References!$A$2:$A${max_ref_row}",
-                allow_blank=False
-            )
-            ws_forms.add_data_validation(form_type_dv)
-            form_type_col = forms_headers.index("Form Type") + 1
-            form_type_dv.add(
-                f"{get_column_letter(form_type_col)}{start_row}:"
-                f"{get_column_letter(form_type_col)}{start_row + num_rows}"
-            )
-
-        # Forms sheet - Is Completed dropdown
-        is_completed_dv = DataValidation(
-            type="list",
-            formula1="=References!$D$2:$D$3",
-            allow_blank=True
-        )
-        ws_forms.add_data_validation(is_completed_dv)
-        is_completed_col = forms_headers.index("Is Completed") + 1
-        is_completed_dv.add(
-            f"{get_column_letter(is_completed_col)}{start_row}:"
-            f"{get_column_letter(is_completed_col)}{start_row + num_rows}"
-        )
-
-        # Fields sheet - Field Type dropdown
-        if field_types:
-            max_ref_row = len(field_types) + 1
-            field_type_dv = DataValidation(
-                type="list",
-                formula1=f"=References!$B$2:$B${max_ref_row}",
-                allow_blank=False
-            )
-            ws_fields.add_data_validation(field_type_dv)
-            field_type_col = fields_headers.index("Field Type") + 1
-            field_type_dv.add(
-                f"{get_column_letter(field_type_col)}{start_row}:"
-                f"{get_column_letter(field_type_col)}{start_row + num_rows}"
-            )
-
-        # Fields sheet - Data Type dropdown
-        if data_types:
-            max_ref_row = len(data_types) + 1
-            data_type_dv = DataValidation(
-                type="list",
-                formula1=f"=References!$C$2:$C${max_ref_row}",
-                allow_blank=False
-            )
-            ws_fields.add_data_validation(data_type_dv)
-            data_type_col = fields_headers.index("Data Type") + 1
-            data_type_dv.add(
-                f"{get_column_letter(data_type_col)}{start_row}:"
-                f"{get_column_letter(data_type_col)}{start_row + num_rows}"
-            )
-
-        # Fields sheet - Required dropdown
-        required_dv = DataValidation(
-            type="list",
-            formula1="=References!$D$2:$D$3",
-            allow_blank=True
-        )
-        ws_fields.add_data_validation(required_dv)
-        required_col = fields_headers.index("Required") + 1
-        required_dv.add(
-            f"{get_column_letter(required_col)}{start_row}:"
-            f"{get_column_letter(required_col)}{start_row + num_rows}"
-        )
-
-        # Fields sheet - Width dropdown
-        width_dv = DataValidation(
-            type="list",
-            formula1="=References!$E$2:$E$7",
-            allow_blank=True
-        )
-        ws_fields.add_data_validation(width_dv)
-        width_col = fields_headers.index("Width") + 1
-        width_dv.add(
-            f"{get_column_letter(width_col)}{start_row}:"
-            f"{get_column_letter(width_col)}{start_row + num_rows}"
-        )
-
-        # =============================
-        # ADD SAMPLE DATA (Optional)
-        # =============================
-        # You can uncomment this section to add sample rows
-
-        # Sample form
-        # ws_forms["A4"] = "Safety Inspection Checklist"
-        # ws_forms["B4"] = form_types[0] if form_types else ""
-        # ws_forms["C4"] = "Monthly safety inspection form"
-        # ws_forms["D4"] = "TRUE"
-
-        # Sample section
-        # ws_sections["A4"] = "Safety Inspection Checklist"
-        # ws_sections["B4"] = "General Information"
-        # ws_sections["C4"] = "Basic inspection details"
-        # ws_sections["D4"] = 1
-
-        # Sample field
-        # ws_fields["A4"] = "Safety Inspection Checklist"
-        # ws_fields["B4"] = "General Information"
-        # ws_fields["C4"] = "Inspector Name"
-        # ws_fields["D4"] = "inspector_name"
-        # ws_fields["E4"] = field_types[0] if field_types else ""
-        # ws_fields["F4"] = data_types[0] if data_types else ""
-        # ws_fields["G4"] = "TRUE"
-        # ws_fields["H4"] = 1
-
-        # =============================
-        # SAVE AND RETURN FILE
-        # =============================
-        # Save workbook to temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
-        wb.save(temp_file.name)
-        temp_file.close()
-
-        # Open for reading
-        file_handle = open(temp_file.name, 'rb')
+        # Template bytes, cached per reference data version (at most a minute stale)
+        content = build_forms_template(get_reference_data_version())
 
         # Return downloadable file
-        response = FileResponse(
-            file_handle,
-            as_attachment=True,
-            filename="Forms_Bulk_Upload_Template.xlsx"
-        )
-
-        # Cleanup on close
-        def cleanup_file():
-            try:
-                file_handle.close()
-                os.remove(temp_file.name)
-            except OSError:
-                pass
-
-        response.close = cleanup_file
-
-        return response
+        return xlsx_response(content, "Forms_Bulk_Upload_Template.xlsx")
 
     except Exception as e:
         logger.exception(f"Error generating template: {e}")
@@ -726,7 +856,6 @@ def export_forms_data(request):
     Only the latest version of each form is exported (based on root_form and version number).
     This allows easy migration of forms between deployments.
     """
-    from django.db.models import Prefetch
 
     try:
         logger.info("Starting forms data export...")
@@ -735,72 +864,93 @@ def export_forms_data(request):
         # Form model uses effective_end_date for soft delete
         # Get only the latest version of each form by grouping by root_form
 
-        # First, get the maximum version for each root_form
-        latest_versions = Form.objects.filter(
-            effective_end_date__isnull=True
-        ).values('root_form').annotate(
-            max_version=Max('version')
+        # Latest active version within each root_form family, as correlated
+        # subqueries so the database picks the latest rows in one query.
+        # Forms whose root was removed (root_form NULL) form a single family.
+        active_forms = Form.objects.filter(effective_end_date__isnull=True)
+        latest_version = Subquery(
+            active_forms.filter(root_form=OuterRef('root_form'))
+            .order_by('-version').values('version')[:1]
         )
-
-        # Build a list of (root_form, max_version) tuples
-        latest_version_filters = Q()
-        for item in latest_versions:
-            latest_version_filters |= Q(
-                root_form=item['root_form'],
-                version=item['max_version']
-            )
-
-        # Prefetch sections with their fields to avoid N+1 queries
-        # This fetches all related data in just a few queries instead of hundreds
-        # Note: Using default related names (formsections_set, formfields_set)
-        fields_prefetch = Prefetch(
-            'formfields_set',
-            queryset=FormFields.objects.filter(is_deleted=False)
-                .select_related('field_type', 'field_type__data_type', 'parent_field')
-                .order_by('order', 'created_on')
+        orphan_latest_version = Subquery(
+            active_forms.filter(root_form__isnull=True)
+            .order_by('-version').values('version')[:1]
         )
-
-        sections_prefetch = Prefetch(
-            'formsections_set',
-            queryset=FormSections.objects.filter(is_deleted=False)
-                .prefetch_related(fields_prefetch)
-                .order_by('order', 'created_on')
+        latest_version_filters = (
+            Q(version=latest_version)
+            | Q(root_form__isnull=True, version=orphan_latest_version)
         )
 
-        # Fetch only the latest versions with all related data prefetched
-        forms = Form.objects.filter(
+        # Fetch only the latest versions
+        latest_forms = Form.objects.filter(
             effective_end_date__isnull=True
         ).filter(
             latest_version_filters
-        ).select_related('form_type').prefetch_related(sections_prefetch).order_by('title')
+        )
+        forms = latest_forms.values(
+            'title', 'form_type__name', 'description', 'is_completed'
+        ).order_by('title', 'id')
+
+        # Sections of those forms as one flat, joined query in sheet order
+        sections = FormSections.objects.filter(
+            is_deleted=False,
+            form__in=latest_forms.values('id'),
+        ).values(
+            'form_id', 'form__title', 'name', 'description', 'dependency'
+        ).order_by(
+            'form__title', 'form_id', 'order', 'created_on', 'id'
+        )
+
+        # Fields of those forms as one flat, joined query in sheet order:
+        # sections in order, each top-level field followed by its sub-fields.
+        # Sub-fields are only exported under a live top-level parent in the
+        # same section.
+        fields = FormFields.objects.filter(
+            is_deleted=False,
+            section__is_deleted=False,
+            section__form__in=latest_forms.values('id'),
+        ).filter(
+            Q(parent_field__isnull=True)
+            | Q(
+                parent_field__is_deleted=False,
+                parent_field__section=F('section'),
+                parent_field__parent_field__isnull=True,
+            )
+        ).annotate(
+            parent_label=F('parent_field__label'),
+            group_order=Coalesce('parent_field__order', 'order'),
+            group_created_on=Coalesce('parent_field__created_on', 'created_on'),
+            group_id=Coalesce('parent_field_id', 'id'),
+        ).values(
+            'section_id', 'section__form__title', 'section__name', 'label',
+            'field_type__name', 'field_type__data_type__name', 'required',
+            'additional_info', 'parent_label', 'dependency',
+        ).order_by(
+            'section__form__title', 'section__form_id',
+            'section__order', 'section__created_on', 'section_id',
+            'group_order', 'group_created_on', 'group_id',
+            F('parent_field').asc(nulls_first=True), 'order', 'created_on',
+        )
 
-        if not forms.exists():
+        # Start streaming the forms; the first chunk doubles as the existence
+        # check, so no separate EXISTS or COUNT query is issued
+        forms_iterator = forms.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        first_form = next(forms_iterator, None)
+        if first_form is None:
             return Response(
                 {"status": "failed", "message": "No forms found to export."},
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        logger.info(f"Found {forms.count()} forms (latest versions only) to export")
-
-        # Fetch reference data for dropdowns
-        form_types = list(
-            FormType.objects.filter(effective_end_date__isnull=True)
-            .values_list("name", flat=True)
-            .order_by("name")
-        )
-        field_types = list(
-            FieldType.objects.filter(is_deleted=False)
-            .values_list("name", flat=True)
-            .order_by("name")
-        )
-        data_types = list(
-            DataType.objects.filter(is_deleted=False)
-            .values_list("name", flat=True)
-            .order_by("name")
+        # Reference data for dropdowns, shared with the template download and
+        # cached per reference data version (at most a minute stale)
+        form_types, field_types, data_types, _ = get_template_dropdown_data(
+            get_reference_data_version()
         )
 
-        # Create workbook
-        wb = Workbook()
+        # Create write-only workbook; rows are streamed to disk as they are
+        # appended (column widths must be set before the first append)
+        wb = Workbook(write_only=True)
 
         # Define common variables
         num_rows = 100
@@ -809,34 +959,7 @@ def export_forms_data(request):
         # =============================
         # SHEET 1: FORMS
         # =============================
-        ws_forms = wb.active
-        ws_forms.title = "Forms"
-
-        # Title row
-        ws_forms.merge_cells("A1:D1")
-        title_cell = ws_forms["A1"]
-        title_cell.value = "Bulk Upload Forms - Data Export"
-        title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Note row
-        ws_forms.merge_cells("A2:D2")
-        note_cell = ws_forms["A2"]
-        note_cell.value = "NOTE: This file contains exported data (latest versions only) from the database. You can upload it to another deployment."
-        note_cell.font = Font(size=10, italic=True, color="FF0000")
-        note_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Header row
-        forms_headers = ["Form Title", "Form Type", "Description", "Is Completed"]
-        header_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        header_font = Font(bold=True, color="000000")
-
-        for col_num, header in enumerate(forms_headers, 1):
-            cell = ws_forms.cell(row=3, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+        ws_forms = wb.create_sheet("Forms")
 
         # Set column widths
         ws_forms.column_dimensions["A"].width = 30
@@ -844,23 +967,17 @@ def export_forms_data(request):
         ws_forms.column_dimensions["C"].width = 40
         ws_forms.column_dimensions["D"].width = 15
 
-        # Populate forms data
-        row_num = start_row
-        for form in forms:
-            ws_forms[f"A{row_num}"] = form.title
-            ws_forms[f"B{row_num}"] = form.form_type.name if form.form_type else ""
-            ws_forms[f"C{row_num}"] = form.description or ""
-            ws_forms[f"D{row_num}"] = "TRUE" if form.is_completed else "FALSE"
-            row_num += 1
-
-        logger.info(f"Exported {row_num - start_row} forms to Forms sheet")
+        # Title, note and header rows
+        forms_headers = ["Form Title", "Form Type", "Description", "Is Completed"]
+        append_sheet_heading(
+            ws_forms,
+            "Bulk Upload Forms - Data Export",
+            "NOTE: This file contains exported data (latest versions only) from the database. You can upload it to another deployment.",
+            forms_headers,
+        )
 
         # Add conditional formatting for duplicates
-        dxf = DifferentialStyle(
-            fill=PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
-            font=Font(color="9C0006", bold=True)
-        )
-        rule = Rule(type="duplicateValues", dxf=dxf, stopIfTrue=False)
+        rule = Rule(type="duplicateValues", dxf=DUPLICATE_HIGHLIGHT, stopIfTrue=False)
         ws_forms.conditional_formatting.add("A4:A103", rule)
 
         # =============================
@@ -868,32 +985,6 @@ def export_forms_data(request):
         # =============================
         ws_sections = wb.create_sheet("Sections")
 
-        # Title row
-        ws_sections.merge_cells("A1:E1")
-        title_cell = ws_sections["A1"]
-        title_cell.value = "Form Sections"
-        title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Note row
-        ws_sections.merge_cells("A2:E2")
-        note_cell = ws_sections["A2"]
-        note_cell.value = "NOTE: Select Form Title from dropdown. Section Order must be unique within each form."
-        note_cell.font = Font(size=10, italic=True, color="FF0000")
-        note_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Header row
-        sections_headers = [
-            "Form Title", "Section Name", "Section Description", "Section Order", "Dependency (JSON)"
-        ]
-
-        for col_num, header in enumerate(sections_headers, 1):
-            cell = ws_sections.cell(row=3, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
         # Set column widths
         ws_sections.column_dimensions["A"].width = 30
         ws_sections.column_dimensions["B"].width = 30
@@ -901,61 +992,22 @@ def export_forms_data(request):
         ws_sections.column_dimensions["D"].width = 15
         ws_sections.column_dimensions["E"].width = 40
 
-        # Populate sections data (using prefetched data - no additional queries)
-        row_num = start_row
-        sections_count = 0
-        for form in forms:
-            # Use prefetched sections instead of querying again
-            sections = list(form.formsections_set.all())
-
-            # Enumerate sections to assign sequential order numbers (1, 2, 3, ...)
-            for idx, section in enumerate(sections, start=1):
-                ws_sections[f"A{row_num}"] = form.title
-                ws_sections[f"B{row_num}"] = section.name
-                ws_sections[f"C{row_num}"] = section.description or ""
-                ws_sections[f"D{row_num}"] = idx  # Use enumerated index instead of section.order
-                ws_sections[f"E{row_num}"] = json.dumps(section.dependency) if section.dependency else ""
-                row_num += 1
-                sections_count += 1
-
-        logger.info(f"Exported {sections_count} sections to Sections sheet")
+        # Title, note and header rows
+        sections_headers = [
+            "Form Title", "Section Name", "Section Description", "Section Order", "Dependency (JSON)"
+        ]
+        append_sheet_heading(
+            ws_sections,
+            "Form Sections",
+            "NOTE: Select Form Title from dropdown. Section Order must be unique within each form.",
+            sections_headers,
+        )
 
         # =============================
         # SHEET 3: FIELDS
         # =============================
         ws_fields = wb.create_sheet("Fields")
 
-        # Title row
-        ws_fields.merge_cells("A1:L1")
-        title_cell = ws_fields["A1"]
-        title_cell.value = "Form Fields"
-        title_cell.font = Font(size=14, bold=True, color="FFFFFF")
-        title_cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-        title_cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Note row
-        ws_fields.merge_cells("A2:L2")
-        note_cell = ws_fields["A2"]
-        note_cell.value = (
-            "NOTE: Select Form Title, Section Name, Field Type, Data Type, and Width from dropdowns. "
-            "Options should be JSON array like: [\"Option1\",\"Option2\"]. Field Name will be auto-generated."
-        )
-        note_cell.font = Font(size=10, italic=True, color="FF0000")
-        note_cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-        # Header row
-        fields_headers = [
-            "Form Title", "Section Name", "Field Label",
-            "Field Type", "Data Type", "Required", "Field Order",
-            "Width", "Options", "Parent Field", "Dependency", "Additional Info"
-        ]
-
-        for col_num, header in enumerate(fields_headers, 1):
-            cell = ws_fields.cell(row=3, column=col_num, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
         # Set column widths
         column_widths = {
             "A": 30, "B": 25, "C": 25,
@@ -965,150 +1017,87 @@ def export_forms_data(request):
         for col_letter, width in column_widths.items():
             ws_fields.column_dimensions[col_letter].width = width
 
-        # Populate fields data (using prefetched data - no additional queries)
-        row_num = start_row
-        fields_count = 0
+        # Title, note and header rows
+        fields_headers = [
+            "Form Title", "Section Name", "Field Label",
+            "Field Type", "Data Type", "Required", "Field Order",
+            "Width", "Options", "Parent Field", "Dependency", "Additional Info"
+        ]
+        append_sheet_heading(
+            ws_fields,
+            "Form Fields",
+            "NOTE: Select Form Title, Section Name, Field Type, Data Type, and Width from dropdowns. "
+            "Options should be JSON array like: [\"Option1\",\"Option2\"]. Field Name will be auto-generated.",
+            fields_headers,
+        )
 
-        # Width display mapping (defined once, reused)
-        width_display_map = {
-            "25": "25% (1/4)",
-            "33": "33% (1/3)",
-            "50": "50% (1/2)",
-            "66": "66% (2/3)",
-            "75": "75% (3/4)",
-            "100": "100% (Full)"
-        }
+        # =============================
+        # POPULATE FORMS, SECTIONS AND FIELDS
+        # =============================
+        # Each sheet is streamed from its own flat query
+        forms_count = 0
+        sections_count = 0
+        fields_count = 0
 
-        for form in forms:
-            # Use prefetched sections instead of querying again
-            for section in form.formsections_set.all():
-                # Get all fields from prefetched data and separate parent/child fields
-                all_fields = list(section.formfields_set.all())
-                parent_fields = [f for f in all_fields if f.parent_field is None]
-                child_fields_by_parent = {}
-                for f in all_fields:
-                    if f.parent_field_id:
-                        if f.parent_field_id not in child_fields_by_parent:
-                            child_fields_by_parent[f.parent_field_id] = []
-                        child_fields_by_parent[f.parent_field_id].append(f)
-
-                # Use a counter for field order within each section
-                field_order_counter = 1
-
-                for field in parent_fields:
-                    ws_fields[f"A{row_num}"] = form.title
-                    ws_fields[f"B{row_num}"] = section.name
-                    ws_fields[f"C{row_num}"] = field.label
-                    ws_fields[f"D{row_num}"] = field.field_type.name if field.field_type else ""
-                    ws_fields[f"E{row_num}"] = field.field_type.data_type.name if field.field_type and field.field_type.data_type else ""
-                    ws_fields[f"F{row_num}"] = "TRUE" if field.required else "FALSE"
-                    ws_fields[f"G{row_num}"] = field_order_counter
-                    field_order_counter += 1
-
-                    # Extract width from additional_info
-                    width = field.additional_info.get("width", "100") if field.additional_info else "100"
-                    ws_fields[f"H{row_num}"] = width_display_map.get(str(width), f"{width}%")
-
-                    # Extract options from additional_info
-                    options = field.additional_info.get("options", []) if field.additional_info else []
-                    ws_fields[f"I{row_num}"] = json.dumps(options) if options else ""
-
-                    # Parent field is empty for parent fields
-                    ws_fields[f"J{row_num}"] = ""
-
-                    # Dependency
-                    ws_fields[f"K{row_num}"] = json.dumps(field.dependency) if field.dependency else ""
-
-                    # Additional Info (excluding width and options)
-                    if field.additional_info:
-                        filtered_info = {k: v for k, v in field.additional_info.items()
-                                       if k not in ["width", "options"]}
-                        ws_fields[f"L{row_num}"] = json.dumps(filtered_info) if filtered_info else ""
-                    else:
-                        ws_fields[f"L{row_num}"] = ""
-
-                    row_num += 1
-                    fields_count += 1
-
-                    # Handle sub-fields from prefetched data (no additional query)
-                    sub_fields = child_fields_by_parent.get(field.id, [])
-
-                    for sub_field in sub_fields:
-                        ws_fields[f"A{row_num}"] = form.title
-                        ws_fields[f"B{row_num}"] = section.name
-                        ws_fields[f"C{row_num}"] = sub_field.label
-                        ws_fields[f"D{row_num}"] = sub_field.field_type.name if sub_field.field_type else ""
-                        ws_fields[f"E{row_num}"] = sub_field.field_type.data_type.name if sub_field.field_type and sub_field.field_type.data_type else ""
-                        ws_fields[f"F{row_num}"] = "TRUE" if sub_field.required else "FALSE"
-                        ws_fields[f"G{row_num}"] = field_order_counter
-                        field_order_counter += 1
-
-                        # Width
-                        width = sub_field.additional_info.get("width", "100") if sub_field.additional_info else "100"
-                        ws_fields[f"H{row_num}"] = width_display_map.get(str(width), f"{width}%")
-
-                        # Options
-                        options = sub_field.additional_info.get("options", []) if sub_field.additional_info else []
-                        ws_fields[f"I{row_num}"] = json.dumps(options) if options else ""
-
-                        # Parent field label
-                        ws_fields[f"J{row_num}"] = field.label
-
-                        # Dependency
-                        ws_fields[f"K{row_num}"] = json.dumps(sub_field.dependency) if sub_field.dependency else ""
-
-                        # Additional Info
-                        if sub_field.additional_info:
-                            filtered_info = {k: v for k, v in sub_field.additional_info.items()
-                                           if k not in ["width", "options"]}
-                            ws_fields[f"L{row_num}"] = json.dumps(filtered_info) if filtered_info else ""
-                        else:
-                            ws_fields[f"L{row_num}"] = ""
-
-                        row_num += 1
-                        fields_count += 1
-
-        logger.info(f"Exported {fields_count} fields to Fields sheet")
+        for form in chain([first_form], forms_iterator):
+            ws_forms.append([
+                form["title"],
+                form["form_type__name"] or "",
+                form["description"] or "",
+                "TRUE" if form["is_completed"] else "FALSE",
+            ])
+            forms_count += 1
+
+        # Section order is renumbered 1, 2, 3, ... within each form
+        current_form_id = None
+        section_order_counter = 0
+        for section in sections.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            if section["form_id"] != current_form_id:
+                current_form_id = section["form_id"]
+                section_order_counter = 0
+            section_order_counter += 1
+
+            ws_sections.append([
+                section["form__title"],
+                section["name"],
+                section["description"] or "",
+                section_order_counter,  # Use sequential index instead of section.order
+                json_cell(section["dependency"]),
+            ])
+            sections_count += 1
+
+        # Fields are streamed from the flat query; field order restarts at 1
+        # in each section
+        current_section_id = None
+        field_order_counter = 0
+        for field in fields.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            if field["section_id"] != current_section_id:
+                current_section_id = field["section_id"]
+                field_order_counter = 0
+            field_order_counter += 1
+
+            ws_fields.append(build_export_field_row(field, field_order_counter))
+            fields_count += 1
+
+        logger.info(f"Exported {forms_count} forms, {sections_count} sections and {fields_count} fields")
 
         # =============================
         # SHEET 4: REFERENCES (Hidden)
         # =============================
         ws_ref = wb.create_sheet("References")
 
-        # Form Types
-        ws_ref["A1"] = "Form Types"
-        ws_ref["A1"].font = Font(bold=True)
-        for i, form_type in enumerate(form_types, start=2):
-            ws_ref[f"A{i}"] = form_type
-
-        # Field Types
-        ws_ref["B1"] = "Field Types"
-        ws_ref["B1"].font = Font(bold=True)
-        for i, field_type in enumerate(field_types, start=2):
-            ws_ref[f"B{i}"] = field_type
-
-        # Data Types
-        ws_ref["C1"] = "Data Types"
-        ws_ref["C1"].font = Font(bold=True)
-        for i, data_type in enumerate(data_types, start=2):
-            ws_ref[f"C{i}"] = data_type
-
-        # Required options
-        ws_ref["D1"] = "Required"
-        ws_ref["D1"].font = Font(bold=True)
-        ws_ref["D2"] = "TRUE"
-        ws_ref["D3"] = "FALSE"
-
-        # Width options
-        ws_ref["E1"] = "Width"
-        ws_ref["E1"].font = Font(bold=True)
-        width_options = ["25% (1/4)", "33% (1/3)", "50% (1/2)", "66% (2/3)", "75% (3/4)", "100% (Full)"]
-        for i, width_value in enumerate(width_options, start=2):
-            ws_ref[f"E{i}"] = width_value
-
         # Hide the reference sheet
         ws_ref.sheet_state = "hidden"
 
+        # Column headers (bold)
+        ref_headers = ["Form Types", "Field Types", "Data Types", "Required", "Width"]
+        ws_ref.append([styled_cell(ws_ref, header, font=BOLD_FONT) for header in ref_headers])
+
+        # One column per list: form types, field types, data types, required
+        # options and width options, written row by row
+        for row in zip_longest(form_types, field_types, data_types, BOOLEAN_OPTIONS, WIDTH_OPTIONS):
+            ws_ref.append(row)
+
         # =============================
         # DATA VALIDATION (Dropdowns)
         # =============================
@@ -1120,11 +1109,11 @@ def export_forms_data(request):
                 formula1=f"=References!$A$2:$A${max_ref_row}",
                 allow_blank=False
             )
-            ws_forms.add_data_validation(form_type_dv)
+            ws_forms.data_validations.append(form_type_dv)
             form_type_col = forms_headers.index("Form Type") + 1
             form_type_dv.add(
-                f"{get_column_letter(form_type_col)}{start_row}:"
-                f"{get_column_letter(form_type_col)}{start_row + num_rows}"
+                f"{COLUMN_LETTERS[form_type_col - 1]}{start_row}:"
+                f"{COLUMN_LETTERS[form_type_col - 1]}{start_row + num_rows}"
             )
 
         # Sections sheet - Form Title dropdown
@@ -1136,11 +1125,11 @@ def export_forms_data(request):
             errorTitle="Invalid Form Title",
             error="Please select a Form Title from the Forms sheet"
         )
-        ws_sections.add_data_validation(form_title_sections_dv)
+        ws_sections.data_validations.append(form_title_sections_dv)
         form_title_col_sections = sections_headers.index("Form Title") + 1
         form_title_sections_dv.add(
-            f"{get_column_letter(form_title_col_sections)}{start_row}:"
-            f"{get_column_letter(form_title_col_sections)}{start_row + num_rows}"
+            f"{COLUMN_LETTERS[form_title_col_sections - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[form_title_col_sections - 1]}{start_row + num_rows}"
         )
 
         # Fields sheet - Form Title dropdown
@@ -1152,11 +1141,11 @@ def export_forms_data(request):
             errorTitle="Invalid Form Title",
             error="Please select a Form Title from the Forms sheet"
         )
-        ws_fields.add_data_validation(form_title_fields_dv)
+        ws_fields.data_validations.append(form_title_fields_dv)
         form_title_col_fields = fields_headers.index("Form Title") + 1
         form_title_fields_dv.add(
-            f"{get_column_letter(form_title_col_fields)}{start_row}:"
-            f"{get_column_letter(form_title_col_fields)}{start_row + num_rows}"
+            f"{COLUMN_LETTERS[form_title_col_fields - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[form_title_col_fields - 1]}{start_row + num_rows}"
         )
 
         # Fields sheet - Section Name dropdown
@@ -1168,11 +1157,11 @@ def export_forms_data(request):
             errorTitle="Invalid Section Name",
             error="Please select a Section Name from the Sections sheet"
         )
-        ws_fields.add_data_validation(section_name_fields_dv)
+        ws_fields.data_validations.append(section_name_fields_dv)
         section_name_col_fields = fields_headers.index("Section Name") + 1
         section_name_fields_dv.add(
-            f"{get_column_letter(section_name_col_fields)}{start_row}:"
-            f"{get_column_letter(section_name_col_fields)}{start_row + num_rows}"
+            f"{COLUMN_LETTERS[section_name_col_fields - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[section_name_col_fields - 1]}{start_row + num_rows}"
         )
 
         # Fields sheet - Field Type dropdown
@@ -1183,11 +1172,11 @@ def export_forms_data(request):
                 formula1=f"=References!$B$2:$B${max_ref_row}",
                 allow_blank=False
             )
-            ws_fields.add_data_validation(field_type_dv)
+            ws_fields.data_validations.append(field_type_dv)
             field_type_col = fields_headers.index("Field Type") + 1
             field_type_dv.add(
-                f"{get_column_letter(field_type_col)}{start_row}:"
-                f"{get_column_letter(field_type_col)}{start_row + num_rows}"
+                f"{COLUMN_LETTERS[field_type_col - 1]}{start_row}:"
+                f"{COLUMN_LETTERS[field_type_col - 1]}{start_row + num_rows}"
             )
 
         # Fields sheet - Data Type dropdown
@@ -1198,11 +1187,11 @@ def export_forms_data(request):
                 formula1=f"=References!$C$2:$C${max_ref_row}",
                 allow_blank=False
             )
-            ws_fields.add_data_validation(data_type_dv)
+            ws_fields.data_validations.append(data_type_dv)
             data_type_col = fields_headers.index("Data Type") + 1
             data_type_dv.add(
-                f"{get_column_letter(data_type_col)}{start_row}:"
-                f"{get_column_letter(data_type_col)}{start_row + num_rows}"
+                f"{COLUMN_LETTERS[data_type_col - 1]}{start_row}:"
+                f"{COLUMN_LETTERS[data_type_col - 1]}{start_row + num_rows}"
             )
 
         # Fields sheet - Required dropdown
@@ -1211,11 +1200,11 @@ def export_forms_data(request):
             formula1="=References!$D$2:$D$3",
             allow_blank=True
         )
-        ws_fields.add_data_validation(required_dv)
+        ws_fields.data_validations.append(required_dv)
         required_col = fields_headers.index("Required") + 1
         required_dv.add(
-            f"{get_column_letter(required_col)}{start_row}:"
-            f"{get_column_letter(required_col)}{start_row + num_rows}"
+            f"{COLUMN_LETTERS[required_col - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[required_col - 1]}{start_row + num_rows}"
         )
 
         # Fields sheet - Width dropdown
@@ -1224,48 +1213,27 @@ def export_forms_data(request):
             formula1="=References!$E$2:$E$7",
             allow_blank=True
         )
-        ws_fields.add_data_validation(width_dv)
+        ws_fields.data_validations.append(width_dv)
         width_col = fields_headers.index("Width") + 1
         width_dv.add(
-            f"{get_column_letter(width_col)}{start_row}:"
-            f"{get_column_letter(width_col)}{start_row + num_rows}"
+            f"{COLUMN_LETTERS[width_col - 1]}{start_row}:"
+            f"{COLUMN_LETTERS[width_col - 1]}{start_row + num_rows}"
         )
 
         # =============================
         # SAVE AND RETURN FILE
         # =============================
-        # Save workbook to temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx")
-        wb.save(temp_file.name)
-        temp_file.close()
-
-        # Open for reading
-        file_handle = open(temp_file.name, 'rb')
+        # Save workbook to memory
+        buffer = io.BytesIO()
+        wb.save(buffer)
 
         # Return downloadable file with timestamp
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"Forms_Export_{timestamp}.xlsx"
 
-        response = FileResponse(
-            file_handle,
-            as_attachment=True,
-            filename=filename
-        )
-
-        # Cleanup on close
-        def cleanup_file():
-            try:
-                file_handle.close()
-                os.remove(temp_file.name)
-            except OSError:
-                pass
-
-        response.close = cleanup_file
-
-        logger.info(f"Successfully exported {forms.count()} forms, {sections_count} sections, {fields_count} fields")
+        logger.info(f"Successfully exported {forms_count} forms, {sections_count} sections, {fields_count} fields")
 
-        return response
+        return xlsx_response(buffer.getvalue(), filename)
 
     except Exception as e:
         logger.exception(f"Error exporting forms data: {e}")